@@ -1,14 +1,59 @@
-import random
 import time
 from abc import ABCMeta, abstractmethod
+from multiprocessing import Pool
+from typing import Callable, List
 
-from maxclique.graph import Clique
+import numpy as np
+
+from maxclique.graph import Clique, Graph, Node
+from maxclique.profiling import DISABLED_PROFILER
+from maxclique.progress import ProgressEvent
 
 
 class Algorithm(metaclass=ABCMeta):
-    def __init__(self, graph, output):
+    def __init__(self, graph, output, seed=None):
+        """
+        :param seed: Entropy of run's random streams or SeedSequence (e.g. spawned
+            for one of consecutive runs), equal seeds give repeatable runs
+        """
         self.graph = graph
         self.output = output
+        self.seed = seed
+        # Independent child streams (e.g. for worker processes) are spawned from it
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        # Nodes of the best clique found by the last run
+        self.best_clique = []
+        self.profiler = DISABLED_PROFILER
+        self.subscribers = []
+
+    def subscribe(self, callback: Callable[[ProgressEvent], None]):
+        """
+        :param callback: Called with progress event after every iteration of the run
+        """
+        self.subscribers.append(callback)
+
+    def _report_progress(
+        self,
+        iteration: int,
+        best_clique_size: int,
+        start_time: float,
+        pheromone: "PheromoneStrategy" = None,
+    ):
+        # Events are built only when somebody listens, hot loops stay untouched otherwise
+        if not self.subscribers:
+            return
+        event = ProgressEvent(
+            iteration=iteration,
+            best_clique_size=best_clique_size,
+            elapsed=time.time() - start_time,
+            pheromone=pheromone.get_stats() if pheromone else None,
+        )
+        for callback in self.subscribers:
+            callback(event)
 
     @abstractmethod
     def run(self):
@@ -25,10 +70,11 @@ class ExecutionResult:
 
 
 class Agent:
-    def __init__(self, graph):
-        self.clique = Clique(graph)
+    def __init__(self, graph, rng: np.random.Generator, pheromone_factors=True):
+        self.clique = Clique(graph, pheromone_factors)
         # Initialize clique with randomly chosen node
-        self.clique.add_node(random.choice(list(graph.nodes)))
+        nodes = graph.node_array
+        self.clique.add_node(int(nodes[rng.integers(len(nodes))]))
         self.graph = graph
         self.finished = False
 
@@ -36,70 +82,444 @@ class Agent:
         return f"{self.__class__.__name__}(clique_size={len(self.clique.nodes)}, finished={self.finished})"
 
 
+def choose_weighted(weights: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws one column index per row of `weights` with probability proportional to its weight.
+    All rows are sampled at once with a single cumulative sum and `searchsorted` call.
+
+    :param weights: Non-negative matrix, every row has to contain positive weight
+    :param rng: Random numbers generator
+    :return: Array of chosen column indexes
+    """
+    rows, columns = weights.shape
+    probabilities = weights / weights.sum(axis=1, keepdims=True)
+    # Row `r` of normalized weights occupies [r, r + 1) range of flat cumulative sum
+    cumulative = np.cumsum(probabilities.ravel())
+    row_ends = cumulative[columns - 1 :: columns]
+    row_starts = np.concatenate([[0.0], row_ends[:-1]])
+    thresholds = row_starts + rng.random(rows) * (row_ends - row_starts)
+
+    chosen = np.searchsorted(cumulative, thresholds, side="right")
+    chosen -= np.arange(rows) * columns
+    # Guard against float rounding pushing threshold past the last positive weight
+    last_positive = columns - 1 - np.argmax(weights[:, ::-1] > 0, axis=1)
+    return np.minimum(chosen, last_positive)
+
+
+def improve_clique(graph, nodes, steps, rng, tabu_tenure) -> List[Node]:
+    """
+    Plateau local search with tabu. Nodes connected to the whole clique are added,
+    if there is none, node missing exactly one clique neighbour is swapped with that
+    neighbour (1-swap), which may free nodes to be added in the next step, so pairs of
+    steps also realize (1,2)-swaps. Removed node can't be added back for `tabu_tenure` steps.
+    For every node number of clique members it is not connected to is kept up to date,
+    so each move costs one adjacency row update.
+
+    :param nodes: Nodes of initial clique
+    :param steps: Maximal number of moves
+    :return: Nodes of the largest clique visited
+    """
+    in_clique = np.zeros(graph.node_count, dtype=bool)
+    missing = np.zeros(graph.node_count, dtype=np.int64)
+    allowed_after = np.zeros(graph.node_count, dtype=np.int64)
+
+    def add(node):
+        in_clique[node] = True
+        missing[:] += ~graph.get_adjacency_rows([node])[0]
+
+    def remove(node):
+        in_clique[node] = False
+        missing[:] -= ~graph.get_adjacency_rows([node])[0]
+
+    for node in nodes:
+        add(node)
+    best = list(nodes)
+
+    for step in range(steps):
+        allowed = ~in_clique & (allowed_after <= step)
+        free = np.flatnonzero(allowed & (missing == 0))
+        if len(free):
+            add(rng.choice(free))
+            if np.count_nonzero(in_clique) > len(best):
+                best = np.flatnonzero(in_clique).tolist()
+            continue
+
+        swappable = np.flatnonzero(allowed & (missing == 1))
+        if not len(swappable):
+            break
+        node = rng.choice(swappable)
+        members = np.flatnonzero(in_clique)
+        not_connected = members[~graph.get_adjacency_rows([node])[0][members]][0]
+        remove(not_connected)
+        allowed_after[not_connected] = step + tabu_tenure
+        add(node)
+
+    return best
+
+
+class PheromoneStrategy(metaclass=ABCMeta):
+    """
+    Pheromone model of ant colony optimizer (see Solnon & Fenet, "A study of ACO
+    capabilities for solving the maximum clique problem"). It keeps pheromone trails
+    and turns them into attractiveness of candidate nodes for both construction engines.
+    """
+
+    # Whether `get_factors` reads pheromone factors accumulated by the clique
+    clique_factors = True
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    @abstractmethod
+    def fill(self, value: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def evaporate(self, rho: float, minimum: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def deposit(self, nodes: List[Node], delta: float, maximum: float) -> None:
+        """
+        Lays pheromone on components of clique consisting of `nodes`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_factors(self, clique: Clique, candidates: List[Node]) -> np.ndarray:
+        """
+        :return: Pheromone factors of `candidates` for extending `clique`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_initial_scores(self, start_nodes: np.ndarray) -> np.ndarray:
+        """
+        :return: Matrix of pheromone factors of all nodes, row `i` for clique
+            consisting of `start_nodes[i]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_scores(
+        self, scores: np.ndarray, rows: np.ndarray, added_nodes: np.ndarray
+    ) -> None:
+        """
+        Updates `scores` rows after `added_nodes[i]` was added to clique of `rows[i]`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """
+        :return: Minimal, mean and maximal pheromone
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_trails(self) -> np.ndarray:
+        """
+        :return: Copy of all pheromone trails
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_trails(self, trails: np.ndarray) -> None:
+        """
+        Replaces all pheromone trails with values previously returned by `get_trails`
+
+        :raises ValueError: If `trails` don't match the graph
+        """
+        raise NotImplementedError
+
+    def save(self, path) -> None:
+        """
+        Writes pheromone trails to `.npy` file
+        """
+        np.save(path, self.get_trails())
+
+    def load(self, path) -> None:
+        """
+        Restores pheromone trails written by `save` for the same graph
+
+        :raises ValueError: If saved trails don't match the graph
+        """
+        self.set_trails(np.load(path))
+
+    def get_worker_state(self):
+        """
+        :return: Picklable state passed to worker processes with every task
+        """
+        return None
+
+    @classmethod
+    def for_worker(cls, graph, state) -> "PheromoneStrategy":
+        """
+        Recreates strategy in worker process from `get_worker_state` result
+        """
+        return cls(graph)
+
+
+class EdgePheromone(PheromoneStrategy):
+    """
+    Pheromone on every edge, factor of a candidate is sum of pheromone on edges
+    connecting it with clique nodes. Trails are kept by the graph (in shared memory
+    for worker processes).
+    """
+
+    def fill(self, value):
+        self.graph.fill_pheromone(value)
+
+    def evaporate(self, rho, minimum):
+        self.graph.evaporate_pheromone(rho, minimum)
+
+    def deposit(self, nodes, delta, maximum):
+        self.graph.deposit_pheromone(
+            self.graph.get_edge_ids_between(nodes), delta, maximum
+        )
+
+    def get_factors(self, clique, candidates):
+        return clique.get_pheromone_factors(candidates)
+
+    def get_initial_scores(self, start_nodes):
+        scores = np.zeros((len(start_nodes), self.graph.node_count))
+        owners, neighbours, pheromone = self.graph.get_pheromone_entries(start_nodes)
+        scores[owners, neighbours] += pheromone
+        return scores
+
+    def update_scores(self, scores, rows, added_nodes):
+        owners, neighbours, pheromone = self.graph.get_pheromone_entries(added_nodes)
+        scores[rows[owners], neighbours] += pheromone
+
+    def get_stats(self):
+        return self.graph.get_pheromone_stats()
+
+    def get_trails(self):
+        return self.graph.get_pheromone_trails()
+
+    def set_trails(self, trails):
+        self.graph.set_pheromone_trails(trails)
+
+
+class VertexPheromone(PheromoneStrategy):
+    """
+    Pheromone on every node, factor of a candidate is its own pheromone, so it doesn't
+    depend on the clique. Evaporation and deposit cost O(|V|) instead of O(|E|).
+    """
+
+    clique_factors = False
+
+    def __init__(self, graph, pheromone=None):
+        super().__init__(graph)
+        self._pheromone = np.zeros(graph.node_count) if pheromone is None else pheromone
+
+    def fill(self, value):
+        self._pheromone.fill(value)
+
+    def evaporate(self, rho, minimum):
+        np.maximum(self._pheromone * rho, minimum, out=self._pheromone)
+
+    def deposit(self, nodes, delta, maximum):
+        self._pheromone[nodes] = np.minimum(self._pheromone[nodes] + delta, maximum)
+
+    def get_factors(self, clique, candidates):
+        return self._pheromone[candidates]
+
+    def get_initial_scores(self, start_nodes):
+        return np.tile(self._pheromone, (len(start_nodes), 1))
+
+    def update_scores(self, scores, rows, added_nodes):
+        pass
+
+    def get_stats(self):
+        return {
+            "min": float(self._pheromone.min(initial=np.inf)),
+            "mean": float(self._pheromone.mean()) if len(self._pheromone) else 0.0,
+            "max": float(self._pheromone.max(initial=-np.inf)),
+        }
+
+    def get_trails(self):
+        return self._pheromone.copy()
+
+    def set_trails(self, trails):
+        if np.shape(trails) != self._pheromone.shape:
+            raise ValueError(
+                f"Expected pheromone of {len(self._pheromone)} nodes, got {np.shape(trails)}"
+            )
+        self._pheromone[...] = trails
+
+    def get_worker_state(self):
+        return self._pheromone
+
+    @classmethod
+    def for_worker(cls, graph, state):
+        return cls(graph, state)
+
+
+PHEROMONE_STRATEGIES = {
+    "edge": EdgePheromone,
+    "vertex": VertexPheromone,
+}
+
+
 class AntColonyOptimizerAlgorithm(Algorithm):
     PHEROMONE_MIN = 0.01
     PHEROMONE_MAX = 5
+    LOCAL_SEARCH_TABU_TENURE = 7
 
-    def __init__(self, graph, output, iterations, ants, alpha, rho):
-        super().__init__(graph, output)
+    def __init__(
+        self,
+        graph,
+        output,
+        iterations,
+        ants,
+        alpha,
+        rho,
+        local_search_steps=0,
+        time_budget=None,
+        target_size=None,
+        stagnation_window=None,
+        restarts=0,
+        seed=None,
+        pheromone="edge",
+        warm_start=False,
+    ):
+        """
+        :param local_search_steps: Moves of local search applied to iteration best
+            before pheromone is laid, 0 disables local search
+        :param time_budget: Seconds after which run stops, checked after each iteration
+        :param target_size: Clique size which stops the run as soon as it is found
+        :param stagnation_window: Iterations without improvement of the best clique
+            after which pheromone is reset to its initial value
+        :param restarts: Number of pheromone resets, run stops when stagnation
+            is detected once more
+        :param pheromone: Name of pheromone model from `PHEROMONE_STRATEGIES`
+            or pheromone strategy instance (e.g. shared by consecutive runs)
+        :param warm_start: Continue from current pheromone instead of resetting it
+            to `PHEROMONE_MAX` when run starts
+        """
+        super().__init__(graph, output, seed)
         self.iterations = iterations
         self.ants = ants
         self.alpha = alpha
         self.rho = rho
+        self.local_search_steps = local_search_steps
+        self.time_budget = time_budget
+        self.target_size = target_size
+        self.stagnation_window = stagnation_window
+        self.restarts = restarts
+        if isinstance(pheromone, str):
+            pheromone = PHEROMONE_STRATEGIES[pheromone](graph)
+        self.pheromone = pheromone
+        self.warm_start = warm_start
 
     def __initialize_pheromone(self):
-        for edge in self.graph.edges:
-            self.graph.set_pheromone(edge.node_a, edge.node_b, self.PHEROMONE_MAX)
+        self.pheromone.fill(self.PHEROMONE_MAX)
 
     def __evaporate_pheromone(self):
-        for edge in self.graph.edges:
-            self.graph.set_pheromone(
-                edge.node_a,
-                edge.node_b,
-                max(edge.pheromone * self.rho, self.PHEROMONE_MIN),
-            )
+        self.pheromone.evaporate(self.rho, self.PHEROMONE_MIN)
 
     def __lay_pheromone(self, iter_best: Clique, runtime_best: Clique):
-        for edge in iter_best.edges:
-            delta = 1 / (1 + len(runtime_best.nodes) - len(iter_best.nodes))
-            self.graph.set_pheromone(
-                edge.node_a,
-                edge.node_b,
-                min(edge.pheromone + delta, self.PHEROMONE_MAX),
-            )
+        delta = 1 / (1 + len(runtime_best.nodes) - len(iter_best.nodes))
+        self.pheromone.deposit(list(iter_best.nodes), delta, self.PHEROMONE_MAX)
+
+    def _to_clique(self, nodes: List[Node]) -> Clique:
+        clique = Clique(self.graph, pheromone_factors=False)
+        for node in nodes:
+            clique.add_node(node)
+        return clique
+
+    def _construct_iteration_best(self) -> Clique:
+        """
+        Lets every ant build its clique and returns the largest one
+        """
+        profiler = self.profiler
+        ants = [
+            Agent(self.graph, self.rng, self.pheromone.clique_factors)
+            for _ in range(self.ants)
+        ]
+        for ant in ants:
+            while True:
+                with profiler.phase("get_candidates"):
+                    candidates = ant.clique.get_candidates()
+                if not candidates:
+                    break
+                profiler.record_candidates(len(ant.clique.nodes), len(candidates))
+
+                with profiler.phase("pheromone_factor"):
+                    ph_factors = (
+                        self.pheromone.get_factors(ant.clique, candidates) ** self.alpha
+                    )
+                with profiler.phase("choice"):
+                    next_node = candidates[
+                        choose_weighted(ph_factors[np.newaxis], self.rng)[0]
+                    ]
+                with profiler.phase("add_node"):
+                    ant.clique.add_node(next_node)
+
+        return sorted([ant.clique for ant in ants], key=lambda c: len(c.nodes))[-1]
 
     def run(self):
-        self.graph.enable_cache()
         start_time = time.time()
-        self.__initialize_pheromone()
+        if not self.warm_start:
+            self.__initialize_pheromone()
 
         current_iteration = 0
         runtime_best = None
+        stagnation = 0
+        restarts = 0
+        stop_reason = "iterations"
 
+        profiler = self.profiler
         while current_iteration < self.iterations:
-            ants = [Agent(self.graph) for _ in range(self.ants)]
-            for ant in ants:
-                while candidates := ant.clique.get_candidates():
-                    ph_factors = [
-                        ant.clique.get_pheromone_factor(candidate) ** self.alpha
-                        for candidate in candidates
-                    ]
-                    next_node = random.choices(
-                        population=candidates, weights=ph_factors, k=1
-                    )[0]
-                    ant.clique.add_node(next_node)
-
-            iter_best = sorted(
-                [ant.clique for ant in ants], key=lambda c: len(c.nodes)
-            )[-1]
+            with profiler.phase("construction"):
+                iter_best = self._construct_iteration_best()
+            if self.local_search_steps:
+                with profiler.phase("local_search"):
+                    iter_best = self._to_clique(
+                        improve_clique(
+                            self.graph,
+                            list(iter_best.nodes),
+                            self.local_search_steps,
+                            self.rng,
+                            self.LOCAL_SEARCH_TABU_TENURE,
+                        )
+                    )
             if not runtime_best or len(iter_best.nodes) > len(runtime_best.nodes):
                 runtime_best = iter_best
-            self.__evaporate_pheromone()
-            self.__lay_pheromone(iter_best, runtime_best)
+                stagnation = 0
+            else:
+                stagnation += 1
+            with profiler.phase("evaporation"):
+                self.__evaporate_pheromone()
+            with profiler.phase("deposit"):
+                self.__lay_pheromone(iter_best, runtime_best)
+            profiler.end_iteration()
 
-            print(f"{current_iteration}: {len(runtime_best.nodes)}")
+            self._report_progress(
+                current_iteration,
+                len(runtime_best.nodes),
+                start_time,
+                pheromone=self.pheromone,
+            )
             current_iteration += 1
 
+            if self.target_size and len(runtime_best.nodes) >= self.target_size:
+                stop_reason = "target_size"
+                break
+            if self.time_budget and time.time() - start_time >= self.time_budget:
+                stop_reason = "time_budget"
+                break
+            if self.stagnation_window and stagnation >= self.stagnation_window:
+                if restarts >= self.restarts:
+                    stop_reason = "stagnation"
+                    break
+                # MMAS-style restart, the best clique is kept for pheromone deposits
+                restarts += 1
+                stagnation = 0
+                self.__initialize_pheromone()
+
+        self.best_clique = sorted(runtime_best.nodes)
         return ExecutionResult(
             ants=self.ants,
             iterations=self.iterations,
@@ -107,40 +527,214 @@ class AntColonyOptimizerAlgorithm(Algorithm):
             rho=self.rho,
             best_clique_size=len(runtime_best.nodes),
             execution_time=time.time() - start_time,
+            stop_reason=stop_reason,
+            stop_iteration=current_iteration,
+            restarts=restarts,
         )
 
 
+def construct_best_clique(
+    graph, ants, alpha, rng, profiler=DISABLED_PROFILER, pheromone=None
+) -> List[Node]:
+    """
+    Builds cliques of all `ants` as one batch. Candidates of every ant are kept as rows
+    of boolean mask, pheromone factors as rows of running score matrix updated by
+    pheromone strategy after each step.
+
+    :param pheromone: Pheromone strategy, edge pheromone of `graph` by default
+    :return: Nodes of the largest clique found
+    """
+    pheromone = pheromone or EdgePheromone(graph)
+    rows = np.arange(ants)
+    start_nodes = rng.choice(graph.node_array, ants)
+
+    members = np.zeros((ants, graph.node_count), dtype=bool)
+    members[rows, start_nodes] = True
+    candidates = graph.get_adjacency_rows(start_nodes)
+    scores = pheromone.get_initial_scores(start_nodes)
+
+    active = rows[candidates.any(axis=1)]
+    step = 1
+    while len(active):
+        if profiler.enabled:
+            profiler.record_candidates(step, int(candidates[active].sum()), len(active))
+        with profiler.phase("choice"):
+            weights = np.where(candidates[active], scores[active] ** alpha, 0.0)
+            next_nodes = choose_weighted(weights, rng)
+
+        with profiler.phase("add_node"):
+            members[active, next_nodes] = True
+            candidates[active] &= graph.get_adjacency_rows(next_nodes)
+            pheromone.update_scores(scores, active, next_nodes)
+
+        active = active[candidates[active].any(axis=1)]
+        step += 1
+
+    return np.flatnonzero(members[members.sum(axis=1).argmax()]).tolist()
+
+
+class NumpyAntColonyOptimizerAlgorithm(AntColonyOptimizerAlgorithm):
+    """
+    Ant colony optimizer which builds cliques of all ants of an iteration as one batch,
+    see `construct_best_clique`.
+    """
+
+    def _construct_iteration_best(self) -> Clique:
+        return self._to_clique(
+            construct_best_clique(
+                self.graph,
+                self.ants,
+                self.alpha,
+                self.rng,
+                self.profiler,
+                self.pheromone,
+            )
+        )
+
+
+ACO_ENGINES = {
+    "python": AntColonyOptimizerAlgorithm,
+    "numpy": NumpyAntColonyOptimizerAlgorithm,
+}
+
+
+_worker_graph = None
+
+
+def _attach_worker_graph(description):
+    global _worker_graph
+    _worker_graph = Graph.attach(description)
+
+
+def _construct_in_worker(ants, alpha, seed_sequence, strategy, pheromone_state):
+    rng = np.random.default_rng(seed_sequence)
+    pheromone = strategy.for_worker(_worker_graph, pheromone_state)
+    return construct_best_clique(_worker_graph, ants, alpha, rng, pheromone=pheromone)
+
+
+class ParallelAntColonyOptimizerAlgorithm(NumpyAntColonyOptimizerAlgorithm):
+    """
+    Ant colony optimizer which splits ants of every iteration between worker processes.
+    Workers read adjacency and edge pheromone from shared memory, vertex pheromone is
+    sent with every task. Iteration best is chosen from bests of all workers.
+    Ants of worker `i` draw random numbers from the `i`-th seed spawned for
+    the iteration, so runs with equal seed and workers count are repeatable.
+    """
+
+    def __init__(self, graph, output, iterations, ants, alpha, rho, workers, **kwargs):
+        super().__init__(graph, output, iterations, ants, alpha, rho, **kwargs)
+        self.workers = workers
+        self._pool = None
+
+    def _construct_iteration_best(self) -> Clique:
+        chunks = [
+            len(chunk)
+            for chunk in np.array_split(np.arange(self.ants), self.workers)
+            if len(chunk)
+        ]
+        seeds = self.seed_sequence.spawn(len(chunks))
+        workers_best = self._pool.starmap(
+            _construct_in_worker,
+            [
+                (
+                    chunk,
+                    self.alpha,
+                    seed,
+                    type(self.pheromone),
+                    self.pheromone.get_worker_state(),
+                )
+                for chunk, seed in zip(chunks, seeds)
+            ],
+        )
+        return self._to_clique(max(workers_best, key=len))
+
+    def run(self):
+        with self.graph.shared() as description:
+            with Pool(
+                self.workers,
+                initializer=_attach_worker_graph,
+                initargs=(description,),
+            ) as self._pool:
+                return super().run()
+
+
+def construct_degree_weighted_cliques(
+    graph, agents, degrees, rng, profiler=DISABLED_PROFILER
+) -> List[Node]:
+    """
+    Builds cliques of all `agents` as one batch, every agent adds candidate chosen with
+    probability proportional to its degree. Candidates of every agent are kept as rows
+    of boolean mask narrowed by adjacency row of each added node.
+
+    :param degrees: Degrees of all graph nodes
+    :return: Nodes of the largest clique found
+    """
+    rows = np.arange(agents)
+    start_nodes = rng.choice(graph.node_array, agents)
+
+    members = np.zeros((agents, graph.node_count), dtype=bool)
+    members[rows, start_nodes] = True
+    candidates = graph.get_adjacency_rows(start_nodes)
+    weights = degrees.astype(np.float64)
+
+    active = rows[candidates.any(axis=1)]
+    step = 1
+    while len(active):
+        if profiler.enabled:
+            profiler.record_candidates(step, int(candidates[active].sum()), len(active))
+        with profiler.phase("choice"):
+            next_nodes = choose_weighted(
+                np.where(candidates[active], weights, 0.0), rng
+            )
+        with profiler.phase("add_node"):
+            members[active, next_nodes] = True
+            candidates[active] &= graph.get_adjacency_rows(next_nodes)
+
+        active = active[candidates[active].any(axis=1)]
+        step += 1
+
+    return np.flatnonzero(members[members.sum(axis=1).argmax()]).tolist()
+
+
 class ReferenceAlgorithm(Algorithm):
-    def __init__(self, graph, output, agents):
-        super().__init__(graph, output)
+    def __init__(self, graph, output, agents, seed=None):
+        super().__init__(graph, output, seed)
         self.iterations = agents
 
     def run(self):
-        self.graph.enable_cache()
         best_clique_size = -1
         start_time = time.time()
 
+        profiler = self.profiler
+        degrees = self.graph.get_degrees()
         iteration = 0
         for agent in range(self.iterations):
-            agent = Agent(graph=self.graph)
+            agent = Agent(graph=self.graph, rng=self.rng, pheromone_factors=False)
+
+            while True:
+                with profiler.phase("get_candidates"):
+                    candidates = agent.clique.get_candidates()
+                if not candidates:
+                    break
+                profiler.record_candidates(len(agent.clique.nodes), len(candidates))
 
-            while candidates := agent.clique.get_candidates():
                 # Select next node by random choice weighted by edges count
-                next_node = random.choices(
-                    candidates,
-                    weights=[
-                        len(self.graph.get_node_edges(node)) for node in candidates
-                    ],
-                    k=1,
-                )[0]
-                agent.clique.add_node(next_node)
+                with profiler.phase("choice"):
+                    weights = degrees[candidates].astype(np.float64)
+                    next_node = candidates[
+                        choose_weighted(weights[np.newaxis], self.rng)[0]
+                    ]
+                with profiler.phase("add_node"):
+                    agent.clique.add_node(next_node)
+            profiler.end_iteration()
 
             last_clique_size = len(agent.clique.nodes)
             if last_clique_size > best_clique_size:
                 best_clique_size = last_clique_size
+                self.best_clique = sorted(agent.clique.nodes)
 
             iteration += 1
-            print(f"{best_clique_size=}, {iteration=}")
+            self._report_progress(iteration, best_clique_size, start_time)
 
         execution_time = time.time() - start_time
         return ExecutionResult(
@@ -148,3 +742,169 @@ class ReferenceAlgorithm(Algorithm):
             best_clique_size=best_clique_size,
             execution_time=execution_time,
         )
+
+
+class BatchReferenceAlgorithm(ReferenceAlgorithm):
+    """
+    Reference algorithm which builds cliques of `batch_size` agents at once,
+    see `construct_degree_weighted_cliques`. Node degrees are computed once per run.
+    """
+
+    BATCH_SIZE = 256
+
+    def __init__(self, graph, output, agents, batch_size=BATCH_SIZE, seed=None):
+        super().__init__(graph, output, agents, seed)
+        self.batch_size = batch_size
+
+    def run(self):
+        best_clique_size = -1
+        start_time = time.time()
+        degrees = self.graph.get_degrees()
+
+        profiler = self.profiler
+        done = 0
+        while done < self.iterations:
+            agents = min(self.batch_size, self.iterations - done)
+            clique = construct_degree_weighted_cliques(
+                self.graph, agents, degrees, self.rng, profiler
+            )
+            profiler.end_iteration()
+
+            if len(clique) > best_clique_size:
+                best_clique_size = len(clique)
+                self.best_clique = clique
+
+            done += agents
+            self._report_progress(done, best_clique_size, start_time)
+
+        execution_time = time.time() - start_time
+        return ExecutionResult(
+            agents=self.iterations,
+            best_clique_size=best_clique_size,
+            execution_time=execution_time,
+        )
+
+
+class _TimeLimitReached(Exception):
+    pass
+
+
+class BranchAndBoundAlgorithm(Algorithm):
+    """
+    Exact maximum clique solver, branch and bound with greedy coloring bound
+    (Tomita's MCQ/MCS family in bitset formulation of San Segundo's BBMC).
+    Candidate sets are Python integers used as bitsets over nodes sorted by degree.
+    """
+
+    CHECK_TIME_EVERY = 1000
+
+    def __init__(self, graph, output, time_limit=None):
+        super().__init__(graph, output)
+        self.time_limit = time_limit
+
+    def __prepare(self):
+        """
+        Builds bitset of neighbours of each node from its CSR neighbours, bit `i`
+        stands for `i`-th node in degree order. Bitsets end at the highest neighbour
+        position, so no dense adjacency matrix is created.
+        """
+        nodes = self.graph.node_array
+        order = np.argsort(-self.graph.get_degrees()[nodes], kind="stable")
+        self._nodes = nodes[order]
+        positions = np.full(self.graph.node_count, -1, dtype=np.int64)
+        positions[self._nodes] = np.arange(len(self._nodes))
+        self._adjacency = []
+        for node in self._nodes:
+            neighbours = positions[self.graph.get_neighbours(node)]
+            bits = np.zeros(neighbours.max() + 1, dtype=bool)
+            bits[neighbours] = True
+            packed = np.packbits(bits, bitorder="little")
+            self._adjacency.append(int.from_bytes(packed.tobytes(), "little"))
+
+    def __greedy_clique(self):
+        """
+        Builds initial lower bound by adding nodes in degree order
+        """
+        clique = []
+        candidates = (1 << len(self._nodes)) - 1
+        while candidates:
+            vertex = (candidates & -candidates).bit_length() - 1
+            clique.append(vertex)
+            candidates &= self._adjacency[vertex]
+        return clique
+
+    def __color_sort(self, candidates, min_color):
+        """
+        Greedily colors `candidates`, vertices of the same color are pairwise non-adjacent,
+        so clique can contain at most one vertex of each color.
+
+        :return: Vertices with color not lower than `min_color` and their colors,
+            in non-decreasing color order
+        """
+        vertices, colors = [], []
+        color = 0
+        uncolored = candidates
+        while uncolored:
+            color += 1
+            available = uncolored
+            while available:
+                bit = available & -available
+                vertex = bit.bit_length() - 1
+                available &= ~(self._adjacency[vertex] | bit)
+                uncolored &= ~bit
+                if color >= min_color:
+                    vertices.append(vertex)
+                    colors.append(color)
+        return vertices, colors
+
+    def __tick(self):
+        self._steps += 1
+        if (
+            self.time_limit is not None
+            and self._steps % self.CHECK_TIME_EVERY == 0
+            and time.time() - self._start_time > self.time_limit
+        ):
+            raise _TimeLimitReached
+
+    def __expand(self, clique, candidates, root=False):
+        best_size = len(self._best)
+        vertices, colors = self.__color_sort(candidates, best_size - len(clique) + 1)
+        for vertex, color in zip(reversed(vertices), reversed(colors)):
+            if len(clique) + color <= len(self._best):
+                return
+            if root:
+                # Root branches come in non-increasing color order, so the current
+                # one bounds every branch which is not finished yet
+                self._upper_bound = color
+            self.__tick()
+
+            clique.append(vertex)
+            new_candidates = candidates & self._adjacency[vertex]
+            if new_candidates:
+                self.__expand(clique, new_candidates)
+            elif len(clique) > len(self._best):
+                self._best = list(clique)
+                self._report_progress(self._steps, len(self._best), self._start_time)
+            clique.pop()
+            candidates &= ~(1 << vertex)
+
+    def run(self):
+        self._start_time = start_time = time.time()
+        self._steps = 0
+        self.__prepare()
+        self._best = self.__greedy_clique()
+        self._upper_bound = len(self._nodes)
+
+        try:
+            self.__expand([], (1 << len(self._nodes)) - 1, root=True)
+            upper_bound = len(self._best)
+        except _TimeLimitReached:
+            upper_bound = max(self._upper_bound, len(self._best))
+
+        self.best_clique = sorted(self._nodes[self._best].tolist())
+        return ExecutionResult(
+            time_limit=self.time_limit,
+            best_clique_size=len(self._best),
+            upper_bound=upper_bound,
+            execution_time=time.time() - start_time,
+        )
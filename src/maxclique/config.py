@@ -6,7 +6,10 @@ PROJECT_ROOT = (Path(__file__) / ".." / ".." / "..").resolve()
 SRC_ROOT = PROJECT_ROOT / "src"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 INPUT_DIR = PROJECT_ROOT / "input"
-BENCHMARK_RESULT = OUTPUT_DIR / "aco" / "rank_C500-9.mtx.csv"
+RESULTS_DIR = OUTPUT_DIR / "results"
+BENCHMARK_FILE = "C500-9.mtx"
+# Tag of ACO results of dedicated (alpha, rho) benchmark ranked by rank_aco_params
+BENCHMARK = "rank"
 MAIN = SRC_ROOT / "maxclique" / "main.py"
 
 """ User level configs """
@@ -1,10 +1,15 @@
-from dataclasses import dataclass
-from functools import cached_property, lru_cache
-from itertools import starmap
-from typing import Iterable, List, Optional, Set
+import os
+from abc import ABCMeta, abstractmethod
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from functools import cached_property
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 import numpy as np
-from scipy.io import mmread
+
+from maxclique.reader import read_graph, read_header, symmetric_keys
 
 
 class NoSuchNodeException(Exception):
@@ -16,8 +21,12 @@ class NoSuchNodeException(Exception):
 Node = int
 
 
-@dataclass(frozen=True, unsafe_hash=True)
-class Edge:
+class Edge(NamedTuple):
+    """
+    Record of directed edge with pheromone at the time it was created. Edges are
+    created only at the public boundary of graphs, algorithms work on node and edge ids.
+    """
+
     node_a: Node
     node_b: Node
     pheromone: float
@@ -27,75 +36,359 @@ class Edge:
         return {self.node_a, self.node_b}
 
 
-NO_EDGE = -1
+WORD_SIZE = 64
+# CSR arrays describing graph structure, stored in cache
+STRUCTURE_ARRAYS = ("_indptr", "_indices", "_edge_ids")
+SHARED_ARRAYS = ("_adjacency",) + STRUCTURE_ARRAYS + ("_pheromone",)
+SPARSE_SHARED_ARRAYS = STRUCTURE_ARRAYS + ("_pheromone",)
+CACHE_SUFFIX = ".npz"
+# Bump when layout of cached arrays changes, so stale caches get rebuilt
+CACHE_VERSION = 3
+# Graphs with lower edge density are loaded as SparseGraph by `open_graph`
+SPARSE_DENSITY = 0.01
+# Number of edges converted to Edge records at once while iterating graph edges
+EDGE_BLOCK_SIZE = 1 << 14
+
+
+def has_bit(bitset: np.ndarray, index: int) -> bool:
+    """
+    :param bitset: Array of 64-bit words
+    :param index: Index of tested bit
+    :return: True if bit at `index` is set in `bitset`
+    """
+    return bool(int(bitset[index // WORD_SIZE]) >> (index % WORD_SIZE) & 1)
+
+
+def _index_dtype(count: int) -> np.dtype:
+    """
+    :return: Smallest of int32 and int64 able to hold indexes lower than `count`
+    """
+    return np.dtype(np.int32 if count < 2**31 else np.int64)
 
 
-class GraphBase:
+class GraphBase(metaclass=ABCMeta):
     def __init__(self):
-        self._edges: Set[Edge] = set()
         self._nodes: Set[Node] = set()
-        self._structure = None
 
     @property
-    def edges(self):
-        return self._edges
+    @abstractmethod
+    def edges(self) -> AbstractSet:
+        raise NotImplementedError
 
     @property
     def nodes(self):
         return self._nodes
 
+    @abstractmethod
     def has_edge_between(self, node_a: Node, node_b: Node) -> bool:
-        return self._structure[node_a][node_b] != NO_EDGE
+        raise NotImplementedError
 
+    @abstractmethod
     def get_edge_by_nodes(self, node_a: Node, node_b: Node) -> Optional[Edge]:
-        return Edge(node_a, node_b, self._structure[node_a][node_b])
+        raise NotImplementedError
+
+
+class EdgeView(AbstractSet):
+    """
+    Read-only set of graph edges in both directions with current pheromone.
+    Length and membership tests don't create Edge records.
+    """
+
+    __slots__ = ("graph",)
+
+    def __init__(self, graph: "Graph"):
+        self.graph = graph
+
+    def __len__(self) -> int:
+        return 2 * self.graph.edge_count
+
+    def __iter__(self) -> Iterator[Edge]:
+        return self.graph.iter_edges()
+
+    def __contains__(self, edge) -> bool:
+        try:
+            node_a, node_b, _ = edge
+        except (TypeError, ValueError):
+            return False
+        try:
+            return self.graph.get_edge_by_nodes(node_a, node_b) == edge
+        except NoSuchNodeException:
+            return False
 
 
 class Graph(GraphBase):
-    def __init__(self, filepath):
+    # Arrays moved to shared memory by `shared`
+    _shared_arrays = SHARED_ARRAYS
+
+    def __init__(self, filepath, cache=True):
         """
         Instantiates new Graph object initializes it with data provided in `filepath` file.
+        Parsed structure is cached in `<filepath>.npz` file next to the source, the cache is
+        used instead of parsing as long as source file size and modification time match.
+        Cache holds only CSR arrays, so it is shared by Graph and SparseGraph.
 
         :param filepath: File containing graph data
         :type filepath: str
+        :param cache: Whether binary cache of graph structure should be used
+        :type cache: bool
         :return: New Graph instance
         :rtype: Graph
         """
         super().__init__()
 
         if filepath:
-            g = mmread(filepath)
-            self._structure = np.ones(shape=g.shape) * -1
+            self.__load(filepath, cache)
+        else:
+            self.__build(0, [], [])
+
+    def __parse(self, filepath) -> None:
+        node_count, keys = read_graph(filepath)
+        self.__build_from_keys(node_count, keys)
+
+    def __load(self, filepath, cache: bool) -> None:
+        # Open file objects (e.g. from argparse.FileType) are resolved by their name
+        source = Path(filepath.name if hasattr(filepath, "read") else filepath)
+        if not cache or not source.is_file():
+            self.__parse(filepath)
+            return
+
+        cache_path = source.with_name(source.name + CACHE_SUFFIX)
+        stat = source.stat()
+        signature = np.array([stat.st_mtime_ns, stat.st_size, CACHE_VERSION])
+        if cache_path.is_file():
+            with np.load(cache_path) as cached:
+                if np.array_equal(cached["signature"], signature):
+                    self.__restore({name: cached[name] for name in STRUCTURE_ARRAYS})
+                    return
+
+        self.__parse(filepath)
+        self.__save_cache(cache_path, signature)
+
+    def __save_cache(self, cache_path: Path, signature: np.ndarray) -> None:
+        """
+        Writes graph structure to `cache_path`. File is written under temporary name and
+        then renamed, so concurrent processes never read partially written cache.
+        """
+        temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temporary_path, "wb") as f:
+                np.savez(
+                    f,
+                    signature=signature,
+                    **{name: getattr(self, name) for name in STRUCTURE_ARRAYS},
+                )
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            # Cache is only an optimization, read-only input directory is fine
+            temporary_path.unlink(missing_ok=True)
+
+    def __restore(self, arrays) -> None:
+        """
+        Sets graph structure from arrays previously built by `__build`
+        """
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        self._node_count = len(self._indptr) - 1
+        self._pheromone = np.zeros(len(self._indices) // 2, dtype=np.float64)
+        self._build_adjacency()
+        self.__protect_structure()
+        self.__add_nodes(np.flatnonzero(np.diff(self._indptr)).tolist())
+
+    def __build(self, node_count: int, rows, cols) -> None:
+        """
+        Builds graph structure from (row, col) pairs of an adjacency matrix.
+
+        :param node_count: Number of rows (and columns) of adjacency matrix
+        :param rows: Row indexes of non-zero matrix entries
+        :param cols: Column indexes of non-zero matrix entries
+        """
+        self.__build_from_keys(node_count, symmetric_keys(node_count, rows, cols))
+
+    def __build_from_keys(self, node_count: int, keys: np.ndarray) -> None:
+        """
+        Builds graph structure from sorted keys `row * node_count + col` of both
+        directions of every edge, as returned by `symmetric_keys`.
+        Pheromone is kept in a flat array indexed by undirected edge id, `_edge_ids`
+        maps CSR (`_indptr`, `_indices`) positions of both edge directions to that id.
+        Keys are not kept, edges are found by binary search within CSR rows, and
+        per edge arrays are int32 whenever node and edge counts fit.
+        """
+        rows, cols = np.divmod(keys, max(node_count, 1))
+
+        self._node_count = node_count
+        self._indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=node_count), out=self._indptr[1:])
+        self._indices = cols.astype(_index_dtype(node_count))
+
+        # Edge ids are assigned to (row < col) positions in key order, (row > col) ones
+        # reuse id of their reverse, which is the rank of reversed key among them
+        upper = rows < cols
+        edge_count = np.count_nonzero(upper)
+        self._edge_ids = np.empty(len(keys), dtype=_index_dtype(edge_count))
+        self._edge_ids[upper] = np.arange(edge_count)
+        lower = ~upper
+        reverse_order = np.argsort(
+            cols[lower] * node_count + rows[lower], kind="stable"
+        )
+        lower_ids = np.empty(edge_count, dtype=np.int64)
+        lower_ids[reverse_order] = np.arange(edge_count)
+        self._edge_ids[lower] = lower_ids
+        self._pheromone = np.zeros(edge_count, dtype=np.float64)
+
+        self._build_adjacency()
+        self.__protect_structure()
+        self.__add_nodes(np.flatnonzero(np.diff(self._indptr)).tolist())
+
+    def _build_adjacency(self) -> None:
+        """
+        Builds packed bitset adjacency (one row of 64-bit words per node) from CSR arrays
+        """
+        node_count = self._node_count
+        rows = np.repeat(np.arange(node_count), np.diff(self._indptr))
+        cols = self._indices.astype(np.int64)
+        words = -(-node_count // WORD_SIZE)
+        self._adjacency = np.zeros((node_count, words), dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), (cols % WORD_SIZE).astype(np.uint64))
+        flat_words, starts = np.unique(
+            rows * words + cols // WORD_SIZE, return_index=True
+        )
+        if len(flat_words):
+            self._adjacency.ravel()[flat_words] = np.bitwise_or.reduceat(bits, starts)
+
+    def __protect_structure(self) -> None:
+        """
+        Marks structure arrays read-only, so views returned by `get_neighbours`
+        and `get_neighbourhood` can't modify the graph. Only pheromone stays writable.
+        """
+        for name in self._shared_arrays:
+            if name != "_pheromone":
+                getattr(self, name).flags.writeable = False
+
+    def _check_nodes(self, *nodes: Node) -> None:
+        """
+        :raises NoSuchNodeException: If any of `nodes` is not a node of the graph
+        """
+        for node in nodes:
+            if not 0 <= node < self._node_count:
+                raise NoSuchNodeException(f"Node {node} is not in the graph")
+
+    def _edge_id(self, node_a: Node, node_b: Node) -> Optional[int]:
+        """
+        :return: Id of edge between `node_a` and `node_b` or None if there is no such edge
+        :raises NoSuchNodeException: If any of the nodes is not in the graph
+        """
+        self._check_nodes(node_a, node_b)
+        start, end = self._indptr[node_a], self._indptr[node_a + 1]
+        index = start + np.searchsorted(self._indices[start:end], node_b)
+        if index < end and self._indices[index] == node_b:
+            return int(self._edge_ids[index])
+        return None
+
+    def __find_positions(self, nodes_a: np.ndarray, nodes_b: np.ndarray) -> np.ndarray:
+        """
+        Vectorized binary search of `nodes_b[i]` within CSR row of `nodes_a[i]`
 
-            for node_a, node_b in zip(g.row, g.col):
-                edge = Edge(node_a, node_b, 0)
-                self.__add_edge(edge)
+        :return: CSR positions of edges between `nodes_a[i]` and `nodes_b[i]`, -1 where
+            there is no edge
+        """
+        low = self._indptr[nodes_a]
+        end = self._indptr[nodes_a + 1]
+        high = end.copy()
+        while len(active := np.flatnonzero(low < high)):
+            middle = (low[active] + high[active]) // 2
+            right = self._indices[middle] < nodes_b[active]
+            low[active[right]] = middle[right] + 1
+            high[active[~right]] = middle[~right]
+        found = np.flatnonzero(low < end)
+        found = found[self._indices[low[found]] == nodes_b[found]]
+        positions = np.full(len(low), -1, dtype=np.int64)
+        positions[found] = low[found]
+        return positions
 
     @property
-    def edges(self):
-        indexes = np.where(self._structure != NO_EDGE)
-        return set(starmap(Edge, zip(*indexes, self._structure[indexes])))
+    def node_count(self) -> int:
+        """
+        :return: Number of rows of graph adjacency matrix (including nodes without edges)
+        """
+        return self._node_count
 
-    def __modify_structure(self, node_a, node_b, value):
-        self._structure[node_a, node_b] = value
-        self._structure[node_b, node_a] = value
+    @property
+    def edge_count(self) -> int:
+        """
+        :return: Number of undirected edges
+        """
+        return len(self._pheromone)
 
-    def __add_edge(self, edge: Edge) -> None:
+    @property
+    def nbytes(self) -> int:
         """
-        Adds edge to the graph
+        :return: Number of bytes taken by graph arrays
+        """
+        return sum(getattr(self, name).nbytes for name in self._shared_arrays)
+
+    @cached_property
+    def node_array(self) -> np.ndarray:
+        """
+        :return: Sorted array of graph nodes
+        """
+        return np.flatnonzero(np.diff(self._indptr))
+
+    @property
+    def edges(self) -> "EdgeView":
+        """
+        :return: Live set-like view of edges in both directions, Edge records are
+            created only while it is iterated
+        """
+        return EdgeView(self)
 
-        :param edge: Edge to be added
+    def iter_edges(self) -> Iterator[Edge]:
+        """
+        :return: Iterator of edges in both directions ordered by (node_a, node_b)
         """
-        self.__add_nodes(edge.nodes)
-        self.__modify_structure(edge.node_a, edge.node_b, edge.pheromone)
+        for start in range(0, len(self._indices), EDGE_BLOCK_SIZE):
+            block = slice(start, start + EDGE_BLOCK_SIZE)
+            cols = self._indices[block]
+            rows = np.searchsorted(
+                self._indptr, np.arange(start, start + len(cols)), side="right"
+            )
+            rows -= 1
+            pheromone = self._pheromone[self._edge_ids[block]]
+            yield from map(Edge, rows.tolist(), cols.tolist(), pheromone.tolist())
 
-    def __add_node(self, node: Node) -> None:
+    def get_edge_ids(self, nodes_a, nodes_b) -> np.ndarray:
         """
-        Adds node to the graph
+        Vectorized lookup of edges between pairs of nodes
 
-        :param node: Node to be added
+        :return: Ids of edges between `nodes_a[i]` and `nodes_b[i]`, -1 where there is no edge
+        :raises NoSuchNodeException: If any of the nodes is not in the graph
+        """
+        nodes_a = np.asarray(nodes_a, dtype=np.int64)
+        nodes_b = np.asarray(nodes_b, dtype=np.int64)
+        for nodes in (nodes_a, nodes_b):
+            if nodes.size and (nodes.min() < 0 or nodes.max() >= self._node_count):
+                raise NoSuchNodeException("Edge lookup of nodes not in the graph")
+        nodes_a, nodes_b = np.broadcast_arrays(nodes_a, nodes_b)
+        positions = self.__find_positions(nodes_a.ravel(), nodes_b.ravel())
+        edge_ids = np.full(len(positions), -1, dtype=np.int64)
+        found = positions >= 0
+        edge_ids[found] = self._edge_ids[positions[found]]
+        return edge_ids.reshape(nodes_a.shape)
+
+    def get_pheromone(self, edge_ids: np.ndarray) -> np.ndarray:
+        """
+        :return: Pheromone on edges of given ids
         """
-        self.nodes.add(node)
+        return self._pheromone[edge_ids]
+
+    def has_edge_between(self, node_a: Node, node_b: Node) -> bool:
+        self._check_nodes(node_a, node_b)
+        return has_bit(self._adjacency[node_a], node_b)
+
+    def get_edge_by_nodes(self, node_a: Node, node_b: Node) -> Optional[Edge]:
+        edge_id = self._edge_id(node_a, node_b)
+        if edge_id is None:
+            return None
+        return Edge(node_a, node_b, float(self._pheromone[edge_id]))
 
     def __add_nodes(self, nodes: Iterable[Node]) -> None:
         """
@@ -106,37 +399,408 @@ class Graph(GraphBase):
         self.nodes.update(nodes)
 
     def __repr__(self) -> str:
-        return f"Graph({len(self.nodes)}, {len(self.edges)})"
+        return f"{type(self).__name__}({len(self.nodes)}, {len(self._indices)})"
+
+    def get_neighbours(self, node: Node) -> np.ndarray:
+        """
+        :param node: Node which neighbours should be returned
+        :returns: Read-only sorted array of nodes directly connected to `node`
+        """
+        return self._indices[self._indptr[node] : self._indptr[node + 1]]
+
+    def get_degree(self, node: Node) -> int:
+        """
+        :param node: Node which degree should be returned
+        :returns: Number of nodes directly connected to `node`
+        """
+        return int(self._indptr[node + 1] - self._indptr[node])
 
     def get_node_edges(self, node: Node) -> Set[Edge]:
         """
         :param node: Node which edges set should be returned
-        :returns: Set of edges connected to `node`
+        :returns: Set of edges connected to `node`, in both directions
         """
-        return {edge for edge in self.edges if node in edge.nodes}
+        start, end = self._indptr[node], self._indptr[node + 1]
+        neighbours = self._indices[start:end].tolist()
+        pheromone = self._pheromone[self._edge_ids[start:end]].tolist()
+        return {
+            edge
+            for neighbour, value in zip(neighbours, pheromone)
+            for edge in (Edge(node, neighbour, value), Edge(neighbour, node, value))
+        }
 
     def get_node_neighbours(self, node: Node) -> Set[Node]:
         """
         :param node: Node which neighbours should be returned
         :returns: Set of nodes directly connected to `node`
         """
-        neighbours = set()
-        node_edges = self.get_node_edges(node)
-        for edge in node_edges:
-            for edge_node in edge.nodes:
-                if edge_node != node:
-                    neighbours.add(edge_node)
-        return neighbours
+        return set(self.get_neighbours(node).tolist())
+
+    def get_neighbourhood(self, node: Node) -> np.ndarray:
+        """
+        :param node: Node which neighbourhood should be returned
+        :returns: Read-only bitset of nodes directly connected to `node`
+        """
+        return self._adjacency[node]
+
+    def bitset_to_nodes(self, bitset: np.ndarray) -> List[Node]:
+        """
+        :param bitset: Bitset of the same width as graph adjacency rows
+        :returns: Sorted list of nodes which bits are set in `bitset`
+        """
+        bits = np.unpackbits(
+            bitset.astype("<u8", copy=False).view(np.uint8), bitorder="little"
+        )
+        return np.flatnonzero(bits).tolist()
+
+    def get_adjacency_rows(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        :param nodes: Array of nodes which neighbourhoods should be returned
+        :returns: Boolean matrix, row `i` marks neighbours of `nodes[i]`
+        """
+        bits = np.unpackbits(
+            self._adjacency[nodes].astype("<u8", copy=False).view(np.uint8),
+            axis=1,
+            bitorder="little",
+        )
+        return bits[:, : self._node_count].astype(bool)
+
+    def create_candidates(
+        self, node: Node, pheromone_factors=True
+    ) -> "BitsetCandidates":
+        """
+        :param node: First node of a clique
+        :param pheromone_factors: Whether pheromone factors of candidates should be kept
+        :return: Candidates of clique containing only `node`
+        """
+        return BitsetCandidates(self, node, pheromone_factors)
+
+    def __gather(self, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param nodes: Array of nodes which edges should be gathered
+        :returns: Tuple of (position in `nodes`, position in CSR arrays) for all edges of `nodes`
+        """
+        starts = self._indptr[nodes]
+        counts = self._indptr[np.asarray(nodes) + 1] - starts
+        owners = np.repeat(np.arange(len(starts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        return owners, np.repeat(starts, counts) + offsets
+
+    def get_pheromone_entries(
+        self, nodes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gathers pheromone on all edges of given nodes in a form suitable for scatter-add
+        into a dense (len(nodes), node_count) matrix.
+
+        :param nodes: Array of nodes which edges should be gathered
+        :returns: Tuple of (position in `nodes`, neighbour, pheromone) arrays
+        """
+        owners, slots = self.__gather(nodes)
+        return owners, self._indices[slots], self._pheromone[self._edge_ids[slots]]
+
+    def get_neighbour_entries(self, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param nodes: Array of nodes which neighbours should be gathered
+        :returns: Tuple of (position in `nodes`, neighbour) arrays
+        """
+        owners, slots = self.__gather(nodes)
+        return owners, self._indices[slots]
+
+    def get_degrees(self) -> np.ndarray:
+        """
+        :returns: Array of node degrees indexed by node
+        """
+        return np.diff(self._indptr)
+
+    def induced_subgraph(self, nodes: List[Node]) -> "Graph":
+        """
+        :param nodes: Nodes of the subgraph, `nodes[i]` becomes node `i` of the subgraph
+        :return: New Graph instance with edges between `nodes`, pheromone is not copied
+        """
+        mapping = np.full(self._node_count, -1, dtype=np.int64)
+        mapping[nodes] = np.arange(len(nodes))
+        rows = mapping[np.repeat(np.arange(self._node_count), np.diff(self._indptr))]
+        cols = mapping[self._indices]
+        kept = (rows >= 0) & (cols >= 0)
+
+        subgraph = type(self)(None)
+        subgraph.__build(len(nodes), rows[kept], cols[kept])
+        return subgraph
+
+    def get_edge_ids_between(self, nodes: List[Node]) -> np.ndarray:
+        """
+        :param nodes: Nodes forming a clique
+        :return: Ids of edges between every pair of `nodes`
+        :raises CliqueConstraintViolationError: If `nodes` don't form a clique
+        :raises NoSuchNodeException: If any of `nodes` is not in the graph
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        first, second = np.triu_indices(len(nodes), k=1)
+        edge_ids = self.get_edge_ids(nodes[first], nodes[second])
+        if (edge_ids < 0).any():
+            raise CliqueConstraintViolationError(
+                f"Nodes {nodes.tolist()} don't form a clique"
+            )
+        return edge_ids
 
     def set_pheromone(self, node_a, node_b, value):
-        self.__modify_structure(node_a, node_b, value)
+        """
+        Sets pheromone on edge between `node_a` and `node_b` to `value`
+
+        :raises ValueError: If there is no edge between the nodes
+        """
+        edge_id = self._edge_id(node_a, node_b)
+        if edge_id is None:
+            raise ValueError(f"No edge between nodes {node_a} and {node_b}")
+        self._pheromone[edge_id] = value
+
+    def fill_pheromone(self, value: float) -> None:
+        """
+        Sets pheromone on all edges to `value`
+        """
+        self._pheromone.fill(value)
+
+    def evaporate_pheromone(self, rho: float, minimum: float) -> None:
+        """
+        Multiplies pheromone on all edges by `rho`, keeping it not lower than `minimum`
+        """
+        np.maximum(self._pheromone * rho, minimum, out=self._pheromone)
+
+    def get_pheromone_trails(self) -> np.ndarray:
+        """
+        :return: Copy of pheromone on all edges indexed by edge id
+        """
+        return self._pheromone.copy()
+
+    def set_pheromone_trails(self, values: np.ndarray) -> None:
+        """
+        Sets pheromone on all edges to values returned by `get_pheromone_trails`
+
+        :raises ValueError: If `values` don't match number of graph edges
+        """
+        if np.shape(values) != self._pheromone.shape:
+            raise ValueError(
+                f"Expected pheromone of {len(self._pheromone)} edges, got {np.shape(values)}"
+            )
+        self._pheromone[...] = values
+
+    def get_pheromone_stats(self) -> dict:
+        """
+        :return: Minimal, mean and maximal pheromone on graph edges
+        """
+        if not len(self._pheromone):
+            return {"min": 0.0, "mean": 0.0, "max": 0.0}
+        return {
+            "min": float(self._pheromone.min()),
+            "mean": float(self._pheromone.mean()),
+            "max": float(self._pheromone.max()),
+        }
+
+    def deposit_pheromone(self, edge_ids: np.ndarray, delta: float, maximum: float):
+        """
+        Adds `delta` to pheromone on given edges, keeping it not greater than `maximum`
+        """
+        np.add.at(self._pheromone, edge_ids, delta)
+        self._pheromone[edge_ids] = np.minimum(self._pheromone[edge_ids], maximum)
+
+    @contextmanager
+    def shared(self):
+        """
+        Moves graph arrays into shared memory blocks for the duration of the context.
+        Pheromone changes are visible to all processes attached with `Graph.attach`.
 
-    def enable_cache(self):
+        :return: Picklable description of shared graph, to be passed to `Graph.attach`
+        """
+        blocks = []
+        description = {
+            "graph_class": type(self),
+            "node_count": self._node_count,
+            "nodes": list(self.nodes),
+        }
+        description["arrays"] = arrays = {}
+        try:
+            for name in self._shared_arrays:
+                array = getattr(self, name)
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                setattr(self, name, _shared_array(block, array.shape, array.dtype))
+                getattr(self, name)[...] = array
+                arrays[name] = (block.name, array.shape, array.dtype.str)
+            self.__protect_structure()
+            yield description
+        finally:
+            for name in arrays:
+                setattr(self, name, np.array(getattr(self, name)))
+            self.__protect_structure()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    @classmethod
+    def attach(cls, description) -> "Graph":
         """
-        Hacky, but it's dumb to calculate it over and over if graph structure never changes after initialization
+        Instantiates Graph backed by shared memory of a graph from another process.
+
+        :param description: Value yielded by `Graph.shared` in the owning process
+        :return: New instance of the same class as the shared graph
         """
-        self.get_node_edges = lru_cache(maxsize=None)(self.get_node_edges)
-        self.get_node_neighbours = lru_cache(maxsize=None)(self.get_node_neighbours)
+        graph = description["graph_class"](None)
+        graph._node_count = description["node_count"]
+        graph.nodes.update(description["nodes"])
+        graph._blocks = []
+        for name, (block_name, shape, dtype) in description["arrays"].items():
+            block = SharedMemory(name=block_name)
+            graph._blocks.append(block)
+            setattr(graph, name, _shared_array(block, shape, dtype))
+        graph.__protect_structure()
+        return graph
+
+
+def _shared_array(block: SharedMemory, shape, dtype) -> np.ndarray:
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+class SparseGraph(Graph):
+    """
+    Graph without bitset adjacency, edges are looked up by binary search within
+    CSR rows, so memory scales with number of edges instead of squared number of nodes.
+    Cliques keep candidates as sorted arrays (see `ArrayCandidates`), bitset methods
+    (`get_neighbourhood`, `bitset_to_nodes`) are not supported.
+    Adjacency matrix rows are still materialized by `get_adjacency_rows`, which is used
+    by numpy engines and local search, one row per ant or clique node.
+    """
+
+    _shared_arrays = SPARSE_SHARED_ARRAYS
+
+    def _build_adjacency(self) -> None:
+        pass
+
+    def has_edge_between(self, node_a: Node, node_b: Node) -> bool:
+        return self._edge_id(node_a, node_b) is not None
+
+    def get_adjacency_rows(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        :param nodes: Array of nodes which neighbourhoods should be returned
+        :returns: Boolean matrix, row `i` marks neighbours of `nodes[i]`
+        """
+        rows = np.zeros((len(nodes), self._node_count), dtype=bool)
+        owners, neighbours = self.get_neighbour_entries(nodes)
+        rows[owners, neighbours] = True
+        return rows
+
+    def create_candidates(
+        self, node: Node, pheromone_factors=True
+    ) -> "ArrayCandidates":
+        """
+        :param node: First node of a clique
+        :param pheromone_factors: Whether pheromone factors of candidates should be kept
+        :return: Candidates of clique containing only `node`
+        """
+        return ArrayCandidates(self, node, pheromone_factors)
+
+
+def open_graph(filepath, cache=True, sparse: Optional[bool] = None) -> Graph:
+    """
+    Loads graph choosing its representation by edge density declared in file header
+    (`.mtx` or `.clq`),
+    graphs with density lower than `SPARSE_DENSITY` are loaded as SparseGraph.
+
+    :param filepath: File containing graph data
+    :param cache: Whether binary cache of graph structure should be used
+    :param sparse: Forces SparseGraph (True) or Graph (False), None chooses by density
+    :return: New Graph or SparseGraph instance
+    """
+    if sparse is None:
+        source = Path(filepath.name if hasattr(filepath, "read") else filepath)
+        try:
+            header = read_header(source)
+        except (OSError, ValueError):
+            header = None
+        pairs = header.node_count * (header.node_count - 1) // 2 if header else 0
+        sparse = bool(pairs) and header.edge_count / pairs < SPARSE_DENSITY
+    return (SparseGraph if sparse else Graph)(filepath, cache)
+
+
+class BitsetCandidates:
+    """
+    Nodes connected to all nodes of a clique in Graph, kept as bitset of the same
+    width as adjacency rows, with pheromone factors of all graph nodes unless they
+    are not requested.
+    """
+
+    def __init__(self, graph: Graph, node: Node, pheromone_factors=True):
+        self.graph = graph
+        self._bits = graph.get_neighbourhood(node).copy()
+        self._factors = np.zeros(graph.node_count) if pheromone_factors else None
+        self.__add_pheromone(node)
+
+    def __add_pheromone(self, node: Node) -> None:
+        if self._factors is None:
+            return
+        _, neighbours, pheromone = self.graph.get_pheromone_entries([node])
+        self._factors[neighbours] += pheromone
+
+    def add(self, node: Node) -> None:
+        """
+        Removes nodes not connected to `node` newly added to the clique
+        """
+        self._bits &= self.graph.get_neighbourhood(node)
+        self.__add_pheromone(node)
+
+    def __contains__(self, node: Node) -> bool:
+        return has_bit(self._bits, node)
+
+    def to_list(self) -> List[Node]:
+        return self.graph.bitset_to_nodes(self._bits)
+
+    def get_factors(self, nodes) -> np.ndarray:
+        return self._factors[nodes]
+
+
+class ArrayCandidates:
+    """
+    Nodes connected to all nodes of a clique in SparseGraph, kept as sorted array
+    with aligned pheromone factors (unless they are not requested), so memory scales
+    with degree of clique nodes.
+    """
+
+    def __init__(self, graph: Graph, node: Node, pheromone_factors=True):
+        self.graph = graph
+        if pheromone_factors:
+            _, self._nodes, self._factors = graph.get_pheromone_entries([node])
+        else:
+            self._nodes, self._factors = graph.get_neighbours(node), None
+
+    def add(self, node: Node) -> None:
+        """
+        Removes nodes not connected to `node` newly added to the clique
+        """
+        if self._factors is None:
+            self._nodes = np.intersect1d(
+                self._nodes, self.graph.get_neighbours(node), assume_unique=True
+            )
+            return
+        _, neighbours, pheromone = self.graph.get_pheromone_entries([node])
+        self._nodes, kept, matched = np.intersect1d(
+            self._nodes, neighbours, assume_unique=True, return_indices=True
+        )
+        self._factors = self._factors[kept] + pheromone[matched]
+
+    def __contains__(self, node: Node) -> bool:
+        index = np.searchsorted(self._nodes, node)
+        return bool(index < len(self._nodes) and self._nodes[index] == node)
+
+    def to_list(self) -> List[Node]:
+        return self._nodes.tolist()
+
+    def get_factors(self, nodes) -> np.ndarray:
+        """
+        :param nodes: Candidate nodes, factors of other nodes are not kept
+        """
+        return self._factors[np.searchsorted(self._nodes, nodes)]
 
 
 class CliqueConstraintViolationError(Exception):
@@ -146,9 +810,20 @@ class CliqueConstraintViolationError(Exception):
 
 
 class Clique(GraphBase):
-    def __init__(self, graph):
+    def __init__(self, graph, pheromone_factors=True):
+        """
+        :param graph: Graph the clique belongs to
+        :param pheromone_factors: Whether pheromone factors of candidates should be
+            accumulated, cliques without them don't support `get_pheromone_factors`
+        """
         super().__init__()
         self.graph: Graph = graph
+        self.pheromone_factors = pheromone_factors
+        # Clique nodes in order they were added
+        self._order: List[Node] = []
+        # Nodes connected to all clique nodes with sums of pheromones on edges between
+        # them and clique nodes, None while clique is empty
+        self._candidates = None
 
     def __is_connected_with_all_nodes(self, node: Node) -> bool:
         """
@@ -157,46 +832,92 @@ class Clique(GraphBase):
         :param node: Node for which check should be executed
         :return: True if all clique nodes are connected to `node`, False otherwise
         """
-        return all(
-            self.graph.has_edge_between(node, existing_node)
-            for existing_node in self.nodes
+        return self._candidates is None or node in self._candidates
+
+    @property
+    def edges(self) -> Set[Edge]:
+        """
+        :return: Edges between clique nodes with current pheromone, every edge leads
+            from later added node to earlier one
+        """
+        order = np.asarray(self._order, dtype=np.int64)
+        earlier, later = np.triu_indices(len(order), k=1)
+        edge_ids = self.graph.get_edge_ids(order[later], order[earlier])
+        exists = edge_ids >= 0
+        return set(
+            map(
+                Edge,
+                order[later][exists].tolist(),
+                order[earlier][exists].tolist(),
+                self.graph.get_pheromone(edge_ids[exists]).tolist(),
+            )
+        )
+
+    def has_edge_between(self, node_a: Node, node_b: Node) -> bool:
+        """
+        :return: True if both nodes belong to the clique and are connected in the graph
+        """
+        return (
+            node_a in self.nodes
+            and node_b in self.nodes
+            and self.graph.has_edge_between(node_a, node_b)
         )
 
+    def get_edge_by_nodes(self, node_a: Node, node_b: Node) -> Optional[Edge]:
+        """
+        :return: Graph edge between `node_a` and `node_b` if both belong to the clique
+        """
+        if node_a in self.nodes and node_b in self.nodes:
+            return self.graph.get_edge_by_nodes(node_a, node_b)
+        return None
+
     def add_node(self, node: Node, unsafe=True):
         """
-        Adds `node` to clique. Also adds edges between `node` and existing clique nodes.
+        Adds `node` to clique. Edges between clique nodes are not stored, see `edges`.
 
         :param node: Node to be added to clique
         :raises CliqueConstraintViolationError: if node given as argument cannot be added to clique
         """
         if unsafe or self.__is_connected_with_all_nodes(node):
-            self.edges.update(
-                {
-                    self.graph.get_edge_by_nodes(node, existing_node)
-                    for existing_node in self.nodes
-                }
-            )
+            if node not in self.nodes:
+                self._order.append(node)
             self.nodes.add(node)
+
+            if self._candidates is None:
+                self._candidates = self.graph.create_candidates(
+                    node, self.pheromone_factors
+                )
+            else:
+                self._candidates.add(node)
         else:
             raise CliqueConstraintViolationError(
                 f"Cannot add node {node} because it's not connected to all existing nodes: {self.nodes}"
             )
 
     def get_candidates(self) -> List[Node]:
-        possible_candidates = [
-            node
-            for node in self.graph.nodes
-            if self.__is_connected_with_all_nodes(node)
-        ]
-
-        return possible_candidates
+        if self._candidates is None:
+            return list(self.graph.nodes)
+        return self._candidates.to_list()
 
     def get_pheromone_factor(self, node: Node) -> float:
         """
         Returns pheromone factor for (Node, Clique) pair.
         Pheromone factor is a sum of pheromones on all edges connecting `node` and clique's nodes.
+        Pheromones are accumulated when nodes are added, so later pheromone changes are not reflected.
+        Only factors of candidates are guaranteed to be kept.
         """
-        return sum(
-            self.graph.get_edge_by_nodes(clique_node, node).pheromone
-            for clique_node in self.nodes
-        )
+        return float(self.get_pheromone_factors([node])[0])
+
+    def get_pheromone_factors(self, nodes: List[Node]) -> np.ndarray:
+        """
+        Vectorized version of `get_pheromone_factor`
+
+        :param nodes: Nodes which pheromone factors should be returned
+        :return: Array of pheromone factors aligned with `nodes`
+        :raises ValueError: If the clique doesn't keep pheromone factors
+        """
+        if not self.pheromone_factors:
+            raise ValueError("Pheromone factors of the clique are not kept")
+        if self._candidates is None:
+            return np.zeros(len(nodes))
+        return self._candidates.get_factors(nodes)
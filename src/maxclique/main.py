@@ -1,11 +1,56 @@
 from argparse import ArgumentParser, FileType
 
-from maxclique.algorithms import AntColonyOptimizerAlgorithm, ReferenceAlgorithm
-from maxclique.graph import Graph
+from maxclique.algorithms import (
+    ACO_ENGINES,
+    BatchReferenceAlgorithm,
+    BranchAndBoundAlgorithm,
+    ParallelAntColonyOptimizerAlgorithm,
+    PHEROMONE_STRATEGIES,
+    ReferenceAlgorithm,
+)
+from maxclique.graph import open_graph
+from maxclique.profiling import Profiler
+from maxclique.preprocessing import reduce_graph
+from maxclique.progress import ConsoleProgress, JsonLinesTrace
+
+REF_ENGINES = {
+    "python": ReferenceAlgorithm,
+    "numpy": BatchReferenceAlgorithm,
+}
 
 arg_parser = ArgumentParser()
 arg_parser.add_argument("--input", type=FileType("r"))
 arg_parser.add_argument("--output", type=FileType("a+"))
+arg_parser.add_argument(
+    "--reduce",
+    help="Remove nodes which can't belong to maximum clique before search",
+    action="store_true",
+)
+arg_parser.add_argument(
+    "--profile",
+    help="Write per iteration phase timings to given .json or .csv file",
+)
+arg_parser.add_argument(
+    "--seed",
+    help="Seed of random number generators, equal seeds give repeatable runs",
+    type=int,
+)
+arg_parser.add_argument(
+    "--progress-interval",
+    help="Minimal number of seconds between progress lines printed to console",
+    type=float,
+    default=1.0,
+)
+arg_parser.add_argument(
+    "--trace",
+    help="Write every progress event as JSON line to given file",
+)
+arg_parser.add_argument(
+    "--storage",
+    help="Graph representation, auto chooses sparse one for graphs of low edge density",
+    choices=("auto", "dense", "sparse"),
+    default="auto",
+)
 
 subparsers = arg_parser.add_subparsers(dest="algorithm")
 
@@ -16,33 +61,147 @@ aco.add_argument(
 aco.add_argument("--ants", help="Ants count", type=int, default=100)
 aco.add_argument("--alpha", help="Alpha parameter", type=float, default=2.0)
 aco.add_argument("--rho", help="Rho parameter", type=float, default=0.995)
+aco.add_argument(
+    "--engine",
+    help="Ants construction engine",
+    choices=ACO_ENGINES.keys(),
+    default="python",
+)
+aco.add_argument(
+    "--workers",
+    help="Worker processes sharing ants of each iteration (implies numpy engine)",
+    type=int,
+    default=1,
+)
+aco.add_argument(
+    "--local-search",
+    help="Local search moves applied to iteration best, 0 disables local search",
+    type=int,
+    default=0,
+)
+
+aco.add_argument(
+    "--pheromone",
+    help="Pheromone model, on edges or on nodes",
+    choices=PHEROMONE_STRATEGIES.keys(),
+    default="edge",
+)
+aco.add_argument("--time-budget", help="Stop after given number of seconds", type=float)
+aco.add_argument(
+    "--target-size", help="Stop when clique of given size is found", type=int
+)
+aco.add_argument(
+    "--stagnation-window",
+    help="Reset pheromone after given number of iterations without improvement",
+    type=int,
+)
+aco.add_argument(
+    "--restarts",
+    help="Pheromone resets allowed before run stops on stagnation",
+    type=int,
+    default=0,
+)
+aco.add_argument(
+    "--load-pheromone",
+    help="Start from pheromone saved to given .npy file for the same graph",
+)
+aco.add_argument(
+    "--save-pheromone",
+    help="Save pheromone left by the run to given .npy file",
+)
 
 ref = subparsers.add_parser("ref")
 ref.add_argument("--agents", help="Agents count", type=int, default=10)
+ref.add_argument(
+    "--engine",
+    help="Agents construction engine",
+    choices=REF_ENGINES.keys(),
+    default="python",
+)
+
+exact = subparsers.add_parser("exact")
+exact.add_argument(
+    "--time-limit",
+    help="Time limit in seconds, best clique and upper bound are reported when reached",
+    type=float,
+    default=None,
+)
 
 if __name__ == "__main__":
     args = arg_parser.parse_args()
     algo = None
-    graph = Graph(args.input)
+    sparse = {"auto": None, "dense": False, "sparse": True}[args.storage]
+    graph = open_graph(args.input, sparse=sparse)
+    reduction = None
+    if args.reduce:
+        reduction = reduce_graph(graph)
+        graph = reduction.graph
+        print(f"Reduced graph to {len(graph.nodes)} nodes")
     if args.algorithm == "aco":
-        algo = AntColonyOptimizerAlgorithm(
+        aco_params = dict(
             graph=graph,
             output=args.output,
             iterations=args.iterations,
             ants=args.ants,
             alpha=args.alpha,
             rho=args.rho,
+            local_search_steps=args.local_search,
+            time_budget=args.time_budget,
+            target_size=args.target_size,
+            stagnation_window=args.stagnation_window,
+            restarts=args.restarts,
+            seed=args.seed,
+            pheromone=args.pheromone,
         )
+        if args.workers > 1:
+            algo = ParallelAntColonyOptimizerAlgorithm(
+                workers=args.workers, **aco_params
+            )
+        else:
+            algo = ACO_ENGINES[args.engine](**aco_params)
+        if args.load_pheromone:
+            algo.pheromone.load(args.load_pheromone)
+            algo.warm_start = True
     elif args.algorithm == "ref":
-        algo = ReferenceAlgorithm(
+        algo = REF_ENGINES[args.engine](
             output=args.output,
             graph=graph,
             agents=args.agents,
+            seed=args.seed,
+        )
+    elif args.algorithm == "exact":
+        algo = BranchAndBoundAlgorithm(
+            graph=graph,
+            output=args.output,
+            time_limit=args.time_limit,
         )
     else:
-        print(f"Invalid algorithm: {args.algorithm}. Supported algorithms: aco, ref")
+        print(
+            f"Invalid algorithm: {args.algorithm}. Supported algorithms: aco, ref, exact"
+        )
 
     if algo:
-        result = algo.run()
+        if args.profile:
+            algo.profiler = Profiler()
+        consumers = [ConsoleProgress(args.progress_interval)]
+        if args.trace:
+            consumers.append(JsonLinesTrace(args.trace))
+        for consumer in consumers:
+            algo.subscribe(consumer)
+        try:
+            result = algo.run()
+        finally:
+            for consumer in consumers:
+                consumer.close()
         result.save(args.output)
+        if args.algorithm == "aco" and args.save_pheromone:
+            algo.pheromone.save(args.save_pheromone)
+        if args.profile:
+            algo.profiler.save(args.profile, result)
+        best_clique = algo.best_clique
+        if reduction:
+            best_clique = reduction.to_original(best_clique)
+        print(f"Best clique: {best_clique}")
+        if hasattr(result, "upper_bound"):
+            print(f"Upper bound: {result.upper_bound}")
         print(f"Execution time: {result.execution_time}")
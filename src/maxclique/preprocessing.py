@@ -0,0 +1,88 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from maxclique.graph import Clique, Graph, Node
+
+GREEDY_STARTS = 10
+
+
+class Reduction:
+    """
+    Graph reduced before search together with mapping of its nodes to the original graph
+    """
+
+    def __init__(self, graph: Graph, original_nodes: np.ndarray, lower_bound: int):
+        self.graph = graph
+        self.original_nodes = original_nodes
+        self.lower_bound = lower_bound
+
+    def to_original(self, nodes: List[Node]) -> List[Node]:
+        """
+        :param nodes: Nodes of reduced graph
+        :return: Corresponding nodes of the original graph
+        """
+        return sorted(self.original_nodes[nodes].tolist())
+
+
+def greedy_clique(graph: Graph, starts: int = GREEDY_STARTS) -> List[Node]:
+    """
+    Builds cliques from `starts` nodes of the highest degree, always adding
+    the candidate of the highest degree.
+
+    :return: Nodes of the largest clique found
+    """
+    degrees = graph.get_degrees()
+    best = []
+    for start in np.argsort(-degrees, kind="stable")[:starts].tolist():
+        if not degrees[start]:
+            break
+        clique = Clique(graph, pheromone_factors=False)
+        clique.add_node(start)
+        while candidates := clique.get_candidates():
+            clique.add_node(candidates[int(np.argmax(degrees[candidates]))])
+        if len(clique.nodes) > len(best):
+            best = sorted(clique.nodes)
+    return best
+
+
+def core_order(graph: Graph) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Peels nodes in rounds, each round removes all nodes which degree among remaining
+    nodes is not greater than current core number `k` (raised to the minimal remaining
+    degree when needed). Every node has at most `k` neighbours peeled in the same or
+    later rounds, so peeling order is a degeneracy order.
+
+    :return: Tuple of (nodes in peeling order, core numbers indexed by node)
+    """
+    degrees = graph.get_degrees().copy()
+    alive = np.zeros(graph.node_count, dtype=bool)
+    alive[list(graph.nodes)] = True
+    cores = np.zeros(graph.node_count, dtype=np.int64)
+    order = [np.empty(0, dtype=np.int64)]
+
+    k = 0
+    while alive.any():
+        k = max(k, degrees[alive].min())
+        peeled = np.flatnonzero(alive & (degrees <= k))
+        cores[peeled] = k
+        alive[peeled] = False
+        order.append(peeled)
+        _, neighbours = graph.get_neighbour_entries(peeled)
+        degrees -= np.bincount(neighbours, minlength=graph.node_count)
+
+    return np.concatenate(order), cores
+
+
+def reduce_graph(graph: Graph) -> Reduction:
+    """
+    Finds clique greedily and keeps only nodes of (size - 1)-core of the graph. Every clique
+    not smaller than the greedy one lies within that core, so maximum clique is preserved.
+    Kept nodes are relabeled in degeneracy order.
+
+    :return: Reduced graph with mapping to `graph` nodes
+    """
+    lower_bound = len(greedy_clique(graph))
+    order, cores = core_order(graph)
+    kept = order[cores[order] >= lower_bound - 1]
+    return Reduction(graph.induced_subgraph(kept), kept, lower_bound)
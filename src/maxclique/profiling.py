@@ -0,0 +1,154 @@
+import csv
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+class _Phase:
+    """
+    Reusable context manager adding time spent inside it to profiler's current iteration
+    """
+
+    __slots__ = ("name", "profiler", "start")
+
+    def __init__(self, name, profiler):
+        self.name = name
+        self.profiler = profiler
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        stats = self.profiler._phases[self.name]
+        stats[0] += time.perf_counter() - self.start
+        stats[1] += 1
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    """
+    Collects cumulative time and calls count of named phases and candidate set sizes
+    of construction steps, separately for every iteration. Disabled profiler hands out
+    a shared no-op context manager and ignores records, so instrumentation may stay
+    in hot loops.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.iterations = []
+        self._phase_managers = {}
+        self._phases = defaultdict(lambda: [0.0, 0])
+        self._candidates = defaultdict(lambda: [0, 0])
+
+    def phase(self, name: str):
+        """
+        :param name: Name of measured phase
+        :return: Context manager measuring time spent inside it
+        """
+        if not self.enabled:
+            return NULL_PHASE
+        if name not in self._phase_managers:
+            self._phase_managers[name] = _Phase(name, self)
+        return self._phase_managers[name]
+
+    def record_candidates(self, step: int, sizes_sum: int, observations: int = 1):
+        """
+        :param step: Construction step, i.e. size of clique candidates were computed for
+        :param sizes_sum: Sum of candidate set sizes observed in this step
+        :param observations: Number of candidate sets summed in `sizes_sum`
+        """
+        if not self.enabled:
+            return
+        stats = self._candidates[step]
+        stats[0] += sizes_sum
+        stats[1] += observations
+
+    def end_iteration(self):
+        """
+        Closes statistics of the current iteration
+        """
+        if not self.enabled:
+            return
+        self.iterations.append(
+            {
+                "phases": {
+                    name: {"time": total, "calls": calls}
+                    for name, (total, calls) in self._phases.items()
+                },
+                "candidates": [
+                    {
+                        "step": step,
+                        "mean_size": sizes_sum / observations,
+                        "observations": observations,
+                    }
+                    for step, (sizes_sum, observations) in sorted(
+                        self._candidates.items()
+                    )
+                ],
+            }
+        )
+        self._phases.clear()
+        self._candidates.clear()
+
+    def save(self, path, result=None):
+        """
+        Writes collected statistics to `path`. CSV file gets one row per iteration and
+        phase, candidate set sizes go to `<stem>.candidates.csv` (one row per iteration
+        and step) and the execution result to `<stem>.result.csv` next to it.
+        Any other suffix gets JSON with all statistics and the execution result.
+        """
+        path = Path(path)
+        if path.suffix == ".csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["iteration", "phase", "time", "calls"])
+                for iteration, stats in enumerate(self.iterations):
+                    for name, phase in stats["phases"].items():
+                        writer.writerow(
+                            [iteration, name, phase["time"], phase["calls"]]
+                        )
+            with open(path.with_suffix(".candidates.csv"), "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["iteration", "step", "mean_size", "observations"])
+                for iteration, stats in enumerate(self.iterations):
+                    for candidates in stats["candidates"]:
+                        writer.writerow(
+                            [
+                                iteration,
+                                candidates["step"],
+                                candidates["mean_size"],
+                                candidates["observations"],
+                            ]
+                        )
+            if result is not None:
+                with open(path.with_suffix(".result.csv"), "w", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=list(vars(result)))
+                    writer.writeheader()
+                    writer.writerow(vars(result))
+        else:
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "result": vars(result) if result is not None else None,
+                        "iterations": self.iterations,
+                    },
+                    f,
+                    indent=2,
+                )
+
+
+DISABLED_PROFILER = Profiler(enabled=False)
@@ -0,0 +1,63 @@
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    iteration: int
+    best_clique_size: int
+    elapsed: float
+    # Minimal, mean and maximal pheromone, None for algorithms which don't use it
+    pheromone: Optional[dict] = None
+
+
+class ConsoleProgress:
+    """
+    Prints progress events, but not more often than once per `interval` seconds.
+    The last event is always printed when consumer is closed.
+    """
+
+    def __init__(self, interval=1.0, stream=None):
+        self.interval = interval
+        self.stream = stream or sys.stdout
+        self._last_print = None
+        self._pending = None
+
+    def __call__(self, event: ProgressEvent):
+        now = time.monotonic()
+        if self._last_print is None or now - self._last_print >= self.interval:
+            self.__print(event)
+            self._last_print = now
+            self._pending = None
+        else:
+            self._pending = event
+
+    def __print(self, event: ProgressEvent):
+        print(
+            f"{event.iteration}: {event.best_clique_size} ({event.elapsed:.2f}s)",
+            file=self.stream,
+        )
+
+    def close(self):
+        if self._pending:
+            self.__print(self._pending)
+            self._pending = None
+
+
+class JsonLinesTrace:
+    """
+    Writes every progress event as one JSON line to buffered file
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+
+    def __call__(self, event: ProgressEvent):
+        self.file.write(json.dumps(asdict(event)))
+        self.file.write("\n")
+
+    def close(self):
+        self.file.close()
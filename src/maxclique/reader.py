@@ -0,0 +1,181 @@
+"""
+Streaming readers of graph files. Edges are parsed in blocks of text with NumPy and
+merged into sorted, symmetric and duplicate free keys (`row * node_count + col`),
+which are the input of graph builder, so the whole file is never held in memory.
+
+Supported formats are Matrix Market coordinate files (`.mtx`) and DIMACS edge
+files (`.clq`, `p edge <nodes> <edges>` header followed by `e <node> <node>` lines).
+"""
+
+import io
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+import numpy as np
+
+MTX_BANNER = "%%MatrixMarket"
+# Number of characters of edge lines parsed at once
+CHUNK_SIZE = 1 << 22
+
+
+@dataclass(frozen=True)
+class GraphHeader:
+    """
+    Graph size declared in file header, `edge_count` is number of undirected edges
+    and may include duplicates
+    """
+
+    format: str
+    node_count: int
+    edge_count: int
+    symmetric: bool
+
+
+@contextmanager
+def _open_text(source):
+    # Open file objects (e.g. from argparse.FileType) are read from current position
+    if hasattr(source, "read"):
+        yield source
+    else:
+        with open(source) as f:
+            yield f
+
+
+def _read_header(f) -> GraphHeader:
+    """
+    Reads header lines of open graph file, leaving `f` at the first edge line
+
+    :raises ValueError: If header is missing or describes unsupported matrix
+    """
+    banner = f.readline()
+    if banner.startswith(MTX_BANNER):
+        fields = banner.lower().split()
+        if len(fields) < 5 or fields[1:3] != ["matrix", "coordinate"]:
+            raise ValueError(f"Unsupported Matrix Market header: {banner.strip()}")
+        symmetric = fields[4] != "general"
+        for line in iter(f.readline, ""):
+            if line.strip() and not line.startswith("%"):
+                rows, cols, entries = map(int, line.split()[:3])
+                edge_count = entries if symmetric else entries // 2
+                return GraphHeader("mtx", max(rows, cols), edge_count, symmetric)
+        raise ValueError("Missing size line of Matrix Market file")
+
+    line = banner
+    while line:
+        fields = line.split()
+        if fields and fields[0] == "p":
+            if len(fields) < 4:
+                raise ValueError(f"Invalid DIMACS problem line: {line.strip()}")
+            return GraphHeader("clq", int(fields[2]), int(fields[3]), True)
+        if fields and fields[0] != "c":
+            raise ValueError(
+                f"Unexpected line before DIMACS problem line: {line.strip()}"
+            )
+        line = f.readline()
+    raise ValueError("Missing Matrix Market banner or DIMACS problem line")
+
+
+def read_header(source) -> GraphHeader:
+    """
+    :param source: Path of graph file
+    :return: Format, size and symmetry declared in file header
+    """
+    with _open_text(source) as f:
+        return _read_header(f)
+
+
+def _parse_chunk(text: str, header: GraphHeader) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :param text: Complete edge lines
+    :return: Tuple of zero based (row, col) arrays of edges in `text`
+    """
+    # DIMACS lines start with "e", which is skipped as unused column
+    columns, comments = ((0, 1), "%") if header.format == "mtx" else ((1, 2), "c")
+    with warnings.catch_warnings():
+        # Chunk of comments or empty lines has no edges
+        warnings.simplefilter("ignore", UserWarning)
+        entries = np.loadtxt(
+            io.StringIO(text),
+            dtype=np.int64,
+            usecols=columns,
+            ndmin=2,
+            comments=comments,
+        )
+    if len(entries) and (entries.min() < 1 or entries.max() > header.node_count):
+        raise ValueError(f"Edge endpoints must be between 1 and {header.node_count}")
+    return entries[:, 0] - 1, entries[:, 1] - 1
+
+
+def iter_edges(
+    f, header: GraphHeader, chunk_size=CHUNK_SIZE
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    :param f: Open graph file positioned after the header
+    :param chunk_size: Approximate number of characters parsed at once
+    :return: Iterator of zero based (row, col) arrays of edges, one pair per chunk
+    """
+    remainder = ""
+    while block := f.read(chunk_size):
+        text = remainder + block
+        # Line cut by the end of block is parsed with the next one
+        end = text.rfind("\n") + 1
+        remainder = text[end:]
+        if end:
+            yield _parse_chunk(text[:end], header)
+    if remainder.strip():
+        yield _parse_chunk(remainder, header)
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """
+    Sorts `keys` in place and drops duplicates. Stable sort merges already sorted
+    runs (e.g. concatenated chunks) in linear time per run.
+    """
+    keys.sort(kind="stable")
+    unique = np.empty(len(keys), dtype=bool)
+    unique[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=unique[1:])
+    return keys[unique]
+
+
+def symmetric_keys(node_count: int, rows, cols) -> np.ndarray:
+    """
+    :return: Sorted unique keys `row * node_count + col` of both directions of all
+        (row, col) edges, loops are dropped
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    not_loop = rows != cols
+    rows, cols = rows[not_loop], cols[not_loop]
+    return _sorted_unique(
+        np.concatenate([rows * node_count + cols, cols * node_count + rows])
+    )
+
+
+def read_graph(source, chunk_size=CHUNK_SIZE) -> Tuple[int, np.ndarray]:
+    """
+    Streams edges of graph file into sorted, symmetric keys without duplicates.
+    Keys of parsed chunks are merged whenever they outgrow already merged keys,
+    so duplicates never take more than about as much memory as the merged keys.
+
+    :param source: Path or open text file of `.mtx` or `.clq` graph
+    :param chunk_size: Approximate number of characters parsed at once
+    :return: Tuple of (node count, keys `row * node_count + col` of both edge directions)
+    :raises ValueError: If file is not a valid graph file
+    """
+    with _open_text(source) as f:
+        header = _read_header(f)
+        merged = np.empty(0, dtype=np.int64)
+        pending = []
+        pending_size = 0
+        for rows, cols in iter_edges(f, header, chunk_size):
+            pending.append(symmetric_keys(header.node_count, rows, cols))
+            pending_size += len(pending[-1])
+            if pending_size > len(merged):
+                merged = _sorted_unique(np.concatenate([merged, *pending]))
+                pending, pending_size = [], 0
+        if pending:
+            merged = _sorted_unique(np.concatenate([merged, *pending]))
+    return header.node_count, merged
@@ -0,0 +1,187 @@
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import pandas as pd
+
+from maxclique.config import RESULTS_DIR
+
+# Columns of stored results, `file` and `repeat` identify the run, `benchmark` tags
+# results of dedicated benchmarks (null for parameter sweep), the rest are fields
+# of ExecutionResult returned by the algorithm
+SCHEMAS = {
+    "aco": {
+        "file": "string",
+        "benchmark": "string",
+        "repeat": "Int64",
+        "ants": "Int64",
+        "iterations": "Int64",
+        "alpha": "float64",
+        "rho": "float64",
+        "best_clique_size": "Int64",
+        "execution_time": "float64",
+        "stop_reason": "string",
+        "stop_iteration": "Int64",
+        "restarts": "Int64",
+    },
+    "ref": {
+        "file": "string",
+        "repeat": "Int64",
+        "agents": "Int64",
+        "best_clique_size": "Int64",
+        "execution_time": "float64",
+    },
+}
+# Positional columns of headerless CSV files written by ExecutionResult.save
+CSV_COLUMNS = {
+    "aco": [
+        "ants",
+        "iterations",
+        "alpha",
+        "rho",
+        "best_clique_size",
+        "execution_time",
+        "stop_reason",
+        "stop_iteration",
+        "restarts",
+    ],
+    "ref": ["agents", "best_clique_size", "execution_time"],
+}
+# Positional columns of headerless rank CSV files of the older ACO benchmark layout
+RANK_CSV_COLUMNS = ["ants", "alpha", "rho", "best_clique_size", "execution_time"]
+# Names used by analysis scripts and tables
+ANALYSIS_COLUMNS = {"best_clique_size": "score", "execution_time": "t"}
+
+
+def with_schema(frame: pd.DataFrame, algorithm: str) -> pd.DataFrame:
+    """
+    :return: `frame` with columns of `algorithm` schema in schema order and types,
+        missing columns are filled with nulls
+    :raises ValueError: If `frame` has columns which are not part of the schema
+    """
+    schema = SCHEMAS[algorithm]
+    unknown = set(frame.columns).difference(schema)
+    if unknown:
+        raise ValueError(
+            f"Columns {sorted(unknown)} are not part of {algorithm} results schema"
+        )
+    return frame.reindex(columns=list(schema)).astype(schema)
+
+
+def _write_atomic(frame: pd.DataFrame, path: Path) -> None:
+    # Readers see either the previous file or the complete new one
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        frame.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+class ResultStore:
+    """
+    Parquet table of results per algorithm. Writers append rows as separate part files,
+    so any number of processes may append concurrently, parts are merged into
+    the table by `merge` once writers are done.
+    """
+
+    def __init__(self, directory=RESULTS_DIR):
+        self.directory = Path(directory)
+
+    def __table_path(self, algorithm: str) -> Path:
+        return self.directory / f"{algorithm}.parquet"
+
+    def __part_paths(self, algorithm: str):
+        return sorted((self.directory / "parts").glob(f"{algorithm}-*.parquet"))
+
+    def append(self, algorithm: str, rows: Iterable[dict]) -> Optional[Path]:
+        """
+        :param rows: Results as mappings of schema columns to values
+        :return: Path of written part file, None if there were no rows
+        """
+        frame = with_schema(pd.DataFrame(list(rows)), algorithm)
+        if frame.empty:
+            return None
+        parts_dir = self.directory / "parts"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        # Names start with write time, so parts are read in the order they were written
+        name = f"{algorithm}-{time.time_ns()}-{os.getpid()}-{uuid.uuid4().hex}"
+        path = parts_dir / f"{name}.parquet"
+        _write_atomic(frame, path)
+        return path
+
+    def merge(self, algorithm: str) -> None:
+        """
+        Moves rows of all part files into the table of `algorithm`.
+        Must not run concurrently with another merge of the same algorithm.
+        """
+        parts = self.__part_paths(algorithm)
+        if not parts:
+            return
+        table_path = self.__table_path(algorithm)
+        _write_atomic(self.__read([table_path, *parts], algorithm), table_path)
+        for part in parts:
+            part.unlink()
+
+    def load(self, algorithm: str) -> pd.DataFrame:
+        """
+        :return: All stored results of `algorithm`, including not merged parts
+        """
+        return self.__read(
+            [self.__table_path(algorithm), *self.__part_paths(algorithm)], algorithm
+        )
+
+    def import_csv(
+        self,
+        algorithm: str,
+        csv_path,
+        file: str,
+        columns=None,
+        benchmark: Optional[str] = None,
+    ) -> Optional[Path]:
+        """
+        Appends results of headerless CSV file written by ExecutionResult.save
+
+        :param file: Name of input graph file results were computed for
+        :param columns: Positional columns of the file, `CSV_COLUMNS` of `algorithm`
+            by default
+        :param benchmark: Tag of benchmark results belong to, None for parameter sweep
+        :return: Path of written part file, None if CSV file was empty
+        """
+        if not os.path.getsize(csv_path):
+            return None
+        frame = pd.read_csv(csv_path, header=None)
+        frame.columns = (columns or CSV_COLUMNS[algorithm])[: len(frame.columns)]
+        frame.insert(0, "file", file)
+        if benchmark is not None:
+            frame.insert(1, "benchmark", benchmark)
+        return self.append(algorithm, frame.to_dict("records"))
+
+    @staticmethod
+    def __read(paths, algorithm: str) -> pd.DataFrame:
+        frames = [pd.read_parquet(path) for path in paths if path.exists()]
+        if not frames:
+            return with_schema(pd.DataFrame(), algorithm)
+        return with_schema(pd.concat(frames, ignore_index=True), algorithm)
+
+
+def load_experiments(
+    store: Optional[ResultStore] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads parameter sweep results for analysis scripts, results of dedicated benchmarks
+    are left out. Result columns are renamed to `ANALYSIS_COLUMNS` and "searches"
+    column (number of constructed cliques) is added.
+
+    :return: Tuple of (ACO results, reference algorithm results)
+    """
+    store = store or ResultStore()
+    aco_results = store.load("aco")
+    aco_results = aco_results[aco_results["benchmark"].isna()]
+    aco_results = aco_results.reset_index(drop=True).rename(columns=ANALYSIS_COLUMNS)
+    ref_results = store.load("ref").rename(columns=ANALYSIS_COLUMNS)
+    aco_results["searches"] = aco_results["ants"] * aco_results["iterations"]
+    ref_results["searches"] = ref_results["agents"]
+    return aco_results, ref_results
@@ -1,41 +1,31 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from maxclique.config import OUTPUT_DIR, PROJECT_ROOT
+from maxclique.config import PROJECT_ROOT
+from maxclique.results import load_experiments
 from maxclique.scripts.run import TESTED_FILES
 
-files = [f"{file}.csv" for file in TESTED_FILES]
+all_aco_results, all_ref_results = load_experiments()
 
-for file in files:
+for file in TESTED_FILES:
 
     file_name = file.split(".")[0]
 
-    aco_results = pd.read_csv(
-        OUTPUT_DIR / "aco" / file,
-        names=["ants", "iterations", "alpha", "rho", "score", "t"],
-    )
-    ref_results = pd.read_csv(
-        OUTPUT_DIR / "ref" / file,
-        names=["iterations", "score", "t"],
-    )
-
-    # To compare both algorithms we introduced "searches" column which is equal to agents * iterations
-    # For reference algorithm len(agents) == 1 so "searches" is always equal to "iterations"
-    ref_results["searches"] = ref_results["iterations"]
-    aco_results["searches"] = aco_results["ants"] * aco_results["iterations"]
+    aco_results = all_aco_results[all_aco_results["file"] == file]
+    ref_results = all_ref_results[all_ref_results["file"] == file]
 
     # Save result table
     with open(PROJECT_ROOT / "tables" / f'{file_name}.md', 'w') as f:
         f.write(
             pd.concat([
-                ref_results.groupby(['searches']).mean()[['score', 't']],
-                aco_results.groupby(['rho', 'alpha', 'searches']).mean()[['score', 't']],
+                ref_results.groupby(['searches'])[['score', 't']].mean(),
+                aco_results.groupby(['rho', 'alpha', 'searches'])[['score', 't']].mean(),
             ]).sort_values(['score', 't'], ascending=[False, True]).to_markdown())
 
     aco_pivot_tbl = pd.pivot_table(
-        data=aco_results, columns=["rho", "alpha"], index="searches"
+        data=aco_results, values=["score", "t"], columns=["rho", "alpha"], index="searches"
     )
-    ref_pivot_tbl = pd.pivot_table(data=ref_results, index="searches")
+    ref_pivot_tbl = pd.pivot_table(data=ref_results, values=["score", "t"], index="searches")
 
     statistics = (
         ("score", "Rozmiar", f"Średni rozmiar kliki - {file_name}"),
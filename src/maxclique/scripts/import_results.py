@@ -0,0 +1,25 @@
+"""
+Imports results appended to headerless CSV files of output directory into result store
+"""
+
+from maxclique.config import BENCHMARK, OUTPUT_DIR
+from maxclique.results import RANK_CSV_COLUMNS, SCHEMAS, ResultStore
+
+if __name__ == "__main__":
+    store = ResultStore()
+    for algorithm in SCHEMAS:
+        for csv_path in sorted((OUTPUT_DIR / algorithm).glob("*.mtx.csv")):
+            file = csv_path.name[: -len(".csv")]
+            # Rank files hold results of (alpha, rho) benchmark without iterations
+            if file.startswith("rank_"):
+                store.import_csv(
+                    algorithm,
+                    csv_path,
+                    file[len("rank_") :],
+                    columns=RANK_CSV_COLUMNS,
+                    benchmark=BENCHMARK,
+                )
+                continue
+            store.import_csv(algorithm, csv_path, file)
+        store.merge(algorithm)
+        print(f"{algorithm}: {len(store.load(algorithm))} results")
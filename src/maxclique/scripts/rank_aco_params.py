@@ -2,17 +2,19 @@
 Requires benchmark results to be generated
 """
 
-import pandas as pd
+from maxclique.config import BENCHMARK, BENCHMARK_FILE
+from maxclique.results import ANALYSIS_COLUMNS, ResultStore
 
-from maxclique.config import BENCHMARK_RESULT
+results = ResultStore().load("aco").rename(columns=ANALYSIS_COLUMNS)
+is_benchmark = (results["file"] == BENCHMARK_FILE) & (results["benchmark"] == BENCHMARK)
+results = results[is_benchmark.fillna(False)]
 
-if not BENCHMARK_RESULT.exists():
-    print(f"No benchmark results under {BENCHMARK_RESULT.resolve()}")
+if results.empty:
+    print(f"No benchmark results for {BENCHMARK_FILE}")
     exit(-1)
 
-results = pd.read_csv(BENCHMARK_RESULT, names=["ants", "alpha", "rho", "score", "t"])
 rank = (
-    results.groupby(["rho", "alpha"])
+    results.groupby(["rho", "alpha"])[["score", "t"]]
     .mean()
     .sort_values(["score", "t"], ascending=[False, True])
 )
@@ -1,9 +1,12 @@
 from collections import namedtuple
+from functools import lru_cache
 from itertools import product, starmap
 from multiprocessing import Pool, cpu_count
-from subprocess import DEVNULL, call
 
-from maxclique.config import INPUT_DIR, MAIN, OUTPUT_DIR, PYTHON
+from maxclique.algorithms import AntColonyOptimizerAlgorithm, BatchReferenceAlgorithm
+from maxclique.config import INPUT_DIR
+from maxclique.graph import open_graph
+from maxclique.results import ResultStore
 
 AcoParam = namedtuple("AcoParam", ["rho", "alpha"])
 
@@ -22,21 +25,67 @@ ITERATIONS = [
     200,
     300,
 ]
-ACO_PARAMS = list(starmap(AcoParam, product([0.75, 0.80, 0.85, 0.90, 0.95], [1, 2, 3, 4, 5])))
+ACO_PARAMS = list(
+    starmap(AcoParam, product([0.75, 0.80, 0.85, 0.90, 0.95], [1, 2, 3, 4, 5]))
+)
 REPEATS = 10
+# Run of a repeat `r` is seeded with (SEED, r), so every run is reproducible on its own
+# and all configurations compared on a file share random streams of the same repeats
+SEED = 2022
+# Results are written to the store in parts of this many rows
+FLUSH_EVERY = 100
+
+
+@lru_cache(maxsize=None)
+def load_graph(file):
+    """
+    Graph is loaded once per worker process and reused by all configurations it runs,
+    every algorithm run initializes pheromone on its own.
+    """
+    return open_graph(file)
 
 
 def run_ref(*args):
-    file, agents_count, _, iterations = args[0]
-    cmd = f'{PYTHON} {MAIN} --input {file} --output {OUTPUT_DIR / "ref" / f"{file.name}.csv"} ref --agents {agents_count * iterations}'
-    call(cmd, shell=False, stdout=DEVNULL)
+    file, agents_count, repeat, iterations = args[0]
+    algo = BatchReferenceAlgorithm(
+        graph=load_graph(file),
+        output=None,
+        agents=agents_count * iterations,
+        seed=(SEED, repeat),
+    )
+    return "ref", {"file": file.name, "repeat": repeat, **vars(algo.run())}
 
 
 def run_aco(*args):
-    file, agents_count, _, iterations, aco_params = args[0]
+    file, agents_count, repeat, iterations, aco_params = args[0]
     print(f"{file.resolve().name}: {iterations=} {agents_count=} {aco_params=}")
-    cmd = f'{PYTHON} {MAIN} --input {file} --output {OUTPUT_DIR / "aco" / f"{file.name}.csv"} aco --ants {agents_count} --iterations {iterations} --alpha {aco_params.alpha} --rho {aco_params.rho}'
-    call(cmd, shell=False, stdout=DEVNULL)
+    algo = AntColonyOptimizerAlgorithm(
+        graph=load_graph(file),
+        output=None,
+        iterations=iterations,
+        ants=agents_count,
+        alpha=float(aco_params.alpha),
+        rho=float(aco_params.rho),
+        seed=(SEED, repeat),
+    )
+    return "aco", {"file": file.name, "repeat": repeat, **vars(algo.run())}
+
+
+def save_results(results, store):
+    """
+    Appends results streamed back from workers to the store, every part file
+    is written atomically, so an interrupted sweep keeps all flushed results
+    """
+    pending = {}
+    for algorithm, row in results:
+        rows = pending.setdefault(algorithm, [])
+        rows.append(row)
+        if len(rows) >= FLUSH_EVERY:
+            store.append(algorithm, rows)
+            rows.clear()
+    for algorithm, rows in pending.items():
+        store.append(algorithm, rows)
+        store.merge(algorithm)
 
 
 if __name__ == "__main__":
@@ -44,6 +93,7 @@ if __name__ == "__main__":
     args_aco = tuple(
         product(INPUT_FILES, AGENTS, range(REPEATS), ITERATIONS, ACO_PARAMS)
     )
+    store = ResultStore()
     with Pool(cpu_count()) as p:
-        p.map(run_aco, args_aco)
-        p.map(run_ref, args_ref)
+        save_results(p.imap_unordered(run_aco, args_aco), store)
+        save_results(p.imap_unordered(run_ref, args_ref), store)
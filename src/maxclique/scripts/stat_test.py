@@ -1,70 +1,111 @@
-from itertools import permutations
-
 import pandas as pd
 import numpy as np
-from scipy.stats import wilcoxon
+from scipy.stats import rankdata, wilcoxon
 
-from maxclique.config import OUTPUT_DIR, PROJECT_ROOT
+from maxclique.config import PROJECT_ROOT
+from maxclique.results import load_experiments
 from maxclique.scripts.run import TESTED_FILES
 
 ALPHA = .05
+# Samples with ties or zeros up to this size are tested exactly by enumerating all
+# sign assignments, larger ones use normal approximation (as scipy's default method)
+MAX_ENUMERATED_SAMPLES = 13
+
+# Compared statistics with direction in which they are better
+PARAMS = (
+    ('score', 'greater'),
+    ('t', 'less'),
+)
+
+
+def signed_rank_pvalues(differences, alternative):
+    """
+    One-sided Wilcoxon signed-rank test of every row of `differences`, zero differences
+    are split between rank sums. P-values are equal to the ones of `scipy.stats.wilcoxon`
+    with default method, but samples with ties or zeros are tested for all rows at once
+    instead of running scipy's generic permutation test for each of them.
+
+    :param differences: Matrix of paired differences, one tested sample per row
+    :param alternative: 'greater' or 'less'
+    :return: Array of p-values
+    """
+    differences = np.asarray(differences, dtype=float)
+    samples, n = differences.shape
+    pvalues = np.empty(samples)
+    ranks = rankdata(np.abs(differences), axis=1)
+    zeros = differences == 0
+    ties = (np.diff(np.sort(ranks, axis=1), axis=1) == 0).any(axis=1) | zeros.any(axis=1)
+
+    if (~ties).any():
+        pvalues[~ties] = wilcoxon(differences[~ties], alternative=alternative, method='exact', axis=-1)[1]
+    if ties.any() and n > MAX_ENUMERATED_SAMPLES:
+        pvalues[ties] = wilcoxon(differences[ties], alternative=alternative, zero_method='zsplit', axis=-1)[1]
+    elif ties.any():
+        tied_ranks = ranks[ties]
+        zero_half = (tied_ranks * zeros[ties]).sum(axis=1) / 2
+        observed = (tied_ranks * (differences[ties] > 0)).sum(axis=1) + zero_half
+        # Rank sums of positive differences under all 2^n sign assignments, zeros don't change
+        signs = (np.arange(2 ** n)[:, np.newaxis] >> np.arange(n)) & 1
+        null = signs @ (tied_ranks * ~zeros[ties]).T + zero_half
+        if alternative == 'greater':
+            pvalues[ties] = (null >= observed).mean(axis=0)
+        else:
+            pvalues[ties] = (null <= observed).mean(axis=0)
+    return pvalues
+
+
+def is_significantly_better(values, other_values, alternative, alpha=ALPHA):
+    """
+    Paired one-sided Wilcoxon signed-rank test, samples are paired by position
+
+    :param alternative: 'greater' or 'less', direction in which `values` are better
+    :return: True if `values` are better than `other_values` at significance level `alpha`
+    """
+    differences = np.subtract(values, other_values, dtype=float)
+    return signed_rank_pvalues(differences[np.newaxis], alternative)[0] < alpha
+
+
+def compare_algorithms(all_results):
+    """
+    Tests all ordered pairs of algorithms at once, results of every algorithm are
+    gathered into one row of a matrix, so all algorithms need the same number of results.
+
+    :param all_results: Frame of 'score' and 't' indexed by algorithm label
+    :return: Mean results of every algorithm with indexes of algorithms it is better than
+    """
+    grouped = all_results.groupby(level='algorithm')
+    mean_results = grouped.mean()
+    mean_results = mean_results.reset_index()
+    mean_results.index.name = 'L.p.'
 
-files = [f"{file}.csv" for file in TESTED_FILES]
+    pairs = ~np.eye(len(mean_results), dtype=bool)
+    for param_name, param_comparison in PARAMS:
+        values = np.stack([group[param_name].to_numpy(dtype=float) for _, group in grouped])
+        differences = values[:, np.newaxis, :] - values[np.newaxis, :, :]
+        better = np.zeros(pairs.shape, dtype=bool)
+        better[pairs] = signed_rank_pvalues(differences[pairs], param_comparison) < ALPHA
+        mean_results[f'better_{param_name}_than'] = [np.flatnonzero(row).tolist() for row in better]
 
-for file in files:
-    file_name = file.split(".")[0]
+    return mean_results
 
-    aco_results = pd.read_csv(
-        OUTPUT_DIR / "aco" / file,
-        names=["ants", "iterations", "alpha", "rho", "score", "t"],
-    )
-    ref_results = pd.read_csv(
-        OUTPUT_DIR / "ref" / file,
-        names=["iterations", "score", "t"],
-    )
 
-    # To compare both algorithms we introduced "searches" column which is equal to agents * iterations
-    # For reference algorithm len(agents) == 1 so "searches" is always equal to "iterations"
-    ref_results["searches"] = ref_results["iterations"]
-    aco_results["searches"] = aco_results["ants"] * aco_results["iterations"]
+if __name__ == "__main__":
+    aco_results, ref_results = load_experiments()
 
     aco_results['algorithm'] = 'ACO(' + aco_results['searches'].astype(str) + ', ' \
                                + aco_results['alpha'].astype(str) + ', ' \
                                + aco_results['rho'].astype(str) + ')'
     ref_results['algorithm'] = 'REF(' + ref_results['searches'].astype(str) + ')'
-    ref_results.drop(columns=['iterations', 'searches'], inplace=True)
-    aco_results.drop(columns=['ants', 'iterations', 'alpha', 'rho', 'searches'], inplace=True)
-
-    all_results = pd.concat([ref_results, aco_results])
-
-    all_results.set_index('algorithm', inplace=True)
-
-    algorithms = list(np.unique(all_results.index.values))
-    all_pairs = list(permutations(algorithms, 2))
-
-    mean_results = all_results.groupby(['algorithm']).mean()
-    mean_results = mean_results.reset_index()
-    mean_results['better_score_than'] = [[] for _ in range(len(mean_results))]
-    mean_results['better_t_than'] = [[] for _ in range(len(mean_results))]
-    mean_results.index.name = 'L.p.'
-
-    params = (
-        ('score', 'greater'),
-        ('t', 'less'),
-    )
-
-    for alg1, alg2 in all_pairs:
-        for param_name, param_comparison in params:
-            alg1_values = all_results[all_results.index == alg1][param_name]
-            alg2_values = all_results[all_results.index == alg2][param_name]
-
-            w, p = wilcoxon(alg1_values, alg2_values, alternative=param_comparison, zero_method='zsplit')
+    all_results = pd.concat([
+        ref_results[['file', 'algorithm', 'score', 't']],
+        aco_results[['file', 'algorithm', 'score', 't']],
+    ])
+    all_results = all_results[all_results['file'].isin(TESTED_FILES)]
 
-            alg1_idx = (mean_results['algorithm'] == alg1).argmax()
-            alg2_idx = (mean_results['algorithm'] == alg2).argmax()
+    for file, file_results in all_results.groupby('file'):
+        file_name = file.split(".")[0]
 
-            if p < ALPHA:
-                mean_results.at[alg1_idx, f'better_{param_name}_than'].append(alg2_idx)
+        mean_results = compare_algorithms(file_results.drop(columns='file').set_index('algorithm'))
 
-    with open(PROJECT_ROOT / "tables" / f'{file_name}_stats.md', 'w') as f:
-        f.write(mean_results.to_markdown())
+        with open(PROJECT_ROOT / "tables" / f'{file_name}_stats.md', 'w') as f:
+            f.write(mean_results.to_markdown())
@@ -0,0 +1,152 @@
+"""
+Races ACO parameter configurations on a single graph. In every round each surviving
+configuration is run once with seed of that round, so results are paired by seed.
+Starting from `--first-test` round, configurations which are significantly worse than
+the best one (paired Wilcoxon test of clique sizes, as in stat_test) are eliminated,
+remaining budget is spent on survivors only.
+"""
+
+from argparse import ArgumentParser
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+
+import pandas as pd
+
+from maxclique.algorithms import ACO_ENGINES
+from maxclique.scripts.run import ACO_PARAMS, SEED, load_graph
+from maxclique.scripts.stat_test import ALPHA, is_significantly_better
+
+
+def run_configuration(args):
+    file, aco_params, repeat, iterations, ants, engine = args
+    algo = ACO_ENGINES[engine](
+        graph=load_graph(file),
+        output=None,
+        iterations=iterations,
+        ants=ants,
+        alpha=float(aco_params.alpha),
+        rho=float(aco_params.rho),
+        seed=(SEED, repeat),
+    )
+    result = algo.run()
+    return result.best_clique_size, result.execution_time
+
+
+def race(
+    file,
+    candidates,
+    budget,
+    iterations,
+    ants,
+    engine="numpy",
+    first_test=5,
+    alpha=ALPHA,
+    pool=None,
+):
+    """
+    :param candidates: Compared configurations (AcoParam tuples)
+    :param budget: Maximal number of algorithm runs
+    :param first_test: Number of rounds after which elimination starts
+    :param alpha: Significance level of elimination test
+    :param pool: Process pool running configurations of a round, None runs them in order
+    :return: Frame with mean score and time, runs count and elimination round
+        of every configuration, sorted from the best one
+    """
+    scores = {candidate: [] for candidate in candidates}
+    times = {candidate: [] for candidate in candidates}
+    eliminated = {}
+    alive = list(candidates)
+    map_ = pool.map if pool else map
+
+    spent = 0
+    round_ = 0
+    while len(alive) > 1 and spent + len(alive) <= budget:
+        tasks = [
+            (file, candidate, round_, iterations, ants, engine) for candidate in alive
+        ]
+        for candidate, (score, t) in zip(alive, map_(run_configuration, tasks)):
+            scores[candidate].append(score)
+            times[candidate].append(t)
+        spent += len(alive)
+        round_ += 1
+
+        if round_ >= first_test:
+            best = max(
+                alive,
+                key=lambda c: (
+                    sum(scores[c]) / len(scores[c]),
+                    -sum(times[c]) / len(times[c]),
+                ),
+            )
+            for candidate in alive:
+                if candidate != best and is_significantly_better(
+                    scores[best], scores[candidate], "greater", alpha
+                ):
+                    eliminated[candidate] = round_
+            alive = [candidate for candidate in alive if candidate not in eliminated]
+
+    ranking = pd.DataFrame(
+        [
+            {
+                "rho": candidate.rho,
+                "alpha": candidate.alpha,
+                "score": sum(scores[candidate]) / max(len(scores[candidate]), 1),
+                "t": sum(times[candidate]) / max(len(times[candidate]), 1),
+                "runs": len(scores[candidate]),
+                "eliminated_in_round": eliminated.get(candidate),
+            }
+            for candidate in candidates
+        ]
+    )
+    ranking["eliminated_in_round"] = ranking["eliminated_in_round"].astype("Int64")
+    return ranking.sort_values(
+        ["runs", "score", "t"], ascending=[False, False, True], ignore_index=True
+    )
+
+
+arg_parser = ArgumentParser()
+arg_parser.add_argument("--input", type=Path, required=True)
+arg_parser.add_argument(
+    "--budget",
+    help="Maximal number of algorithm runs",
+    type=int,
+    default=len(ACO_PARAMS) * 10,
+)
+arg_parser.add_argument(
+    "--iterations", help="Number of algorithm iterations", type=int, default=100
+)
+arg_parser.add_argument("--ants", help="Ants count", type=int, default=16)
+arg_parser.add_argument(
+    "--engine",
+    help="Ants construction engine",
+    choices=ACO_ENGINES.keys(),
+    default="numpy",
+)
+arg_parser.add_argument(
+    "--first-test",
+    help="Number of rounds after which configurations are eliminated",
+    type=int,
+    default=5,
+)
+arg_parser.add_argument(
+    "--workers",
+    help="Worker processes running configurations of a round",
+    type=int,
+    default=cpu_count(),
+)
+
+if __name__ == "__main__":
+    args = arg_parser.parse_args()
+    with Pool(args.workers) as p:
+        ranking = race(
+            args.input,
+            ACO_PARAMS,
+            budget=args.budget,
+            iterations=args.iterations,
+            ants=args.ants,
+            engine=args.engine,
+            first_test=args.first_test,
+            pool=p,
+        )
+    print(ranking.to_string())
+    print(f"Runs: {ranking['runs'].sum()} of {args.budget}")
@@ -0,0 +1,132 @@
+from typing import Callable, List
+
+import numpy as np
+
+from maxclique.algorithms import (
+    ACO_ENGINES,
+    ExecutionResult,
+    PHEROMONE_STRATEGIES,
+    ParallelAntColonyOptimizerAlgorithm,
+)
+from maxclique.graph import Graph, Node
+from maxclique.progress import ProgressEvent
+
+
+class Solver:
+    """
+    Ant colony optimizer for repeated queries on the same graph. Graph and pheromone
+    are kept between `solve` calls, the first call starts from pheromone reset to
+    `PHEROMONE_MAX`, later ones continue from pheromone left by the previous call
+    (warm start), so they concentrate on already reinforced cliques from the first
+    iteration. Pheromone can be checkpointed to `.npy` file and restored in another
+    process with `save_pheromone` and `load_pheromone`.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        ants=100,
+        alpha=2.0,
+        rho=0.995,
+        engine="numpy",
+        workers=1,
+        pheromone="edge",
+        local_search_steps=0,
+        seed=None,
+    ):
+        """
+        :param engine: Ants construction engine from `ACO_ENGINES`
+        :param workers: Worker processes sharing ants of each iteration (implies numpy engine)
+        :param pheromone: Name of pheromone model from `PHEROMONE_STRATEGIES`
+        :param seed: Seed of the whole sequence of runs, every run gets its own child seed
+        """
+        self.graph = graph
+        self.ants = ants
+        self.alpha = alpha
+        self.rho = rho
+        self.engine = engine
+        self.workers = workers
+        self.local_search_steps = local_search_steps
+        self.pheromone = PHEROMONE_STRATEGIES[pheromone](graph)
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.subscribers: List[Callable[[ProgressEvent], None]] = []
+        self.best_clique: List[Node] = []
+        self._warm = False
+
+    @property
+    def warm(self) -> bool:
+        """
+        :return: True if next `solve` call continues from current pheromone
+        """
+        return self._warm
+
+    def subscribe(self, callback: Callable[[ProgressEvent], None]) -> None:
+        """
+        Registers `callback` receiving progress events of all runs
+        """
+        self.subscribers.append(callback)
+
+    def solve(
+        self,
+        iterations=100,
+        output=None,
+        time_budget=None,
+        target_size=None,
+        stagnation_window=None,
+        restarts=0,
+    ) -> ExecutionResult:
+        """
+        Runs ant colony optimizer on the graph, see `AntColonyOptimizerAlgorithm`
+        for meaning of stop conditions.
+
+        :return: Result of the run, its best clique is stored in `best_clique`
+        """
+        params = dict(
+            graph=self.graph,
+            output=output,
+            iterations=iterations,
+            ants=self.ants,
+            alpha=self.alpha,
+            rho=self.rho,
+            local_search_steps=self.local_search_steps,
+            time_budget=time_budget,
+            target_size=target_size,
+            stagnation_window=stagnation_window,
+            restarts=restarts,
+            seed=self.seed_sequence.spawn(1)[0],
+            pheromone=self.pheromone,
+            warm_start=self._warm,
+        )
+        if self.workers > 1:
+            algo = ParallelAntColonyOptimizerAlgorithm(workers=self.workers, **params)
+        else:
+            algo = ACO_ENGINES[self.engine](**params)
+        for callback in self.subscribers:
+            algo.subscribe(callback)
+
+        result = algo.run()
+        self._warm = True
+        self.best_clique = algo.best_clique
+        return result
+
+    def reset(self) -> None:
+        """
+        Makes the next `solve` call start from pheromone reset to `PHEROMONE_MAX`
+        """
+        self._warm = False
+
+    def save_pheromone(self, path) -> None:
+        """
+        Writes current pheromone to `.npy` file
+        """
+        self.pheromone.save(path)
+
+    def load_pheromone(self, path) -> None:
+        """
+        Restores pheromone written by `save_pheromone` for the same graph,
+        the next `solve` call continues from it.
+
+        :raises ValueError: If saved pheromone doesn't match the graph
+        """
+        self.pheromone.load(path)
+        self._warm = True
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+from src.maxclique.graph import Graph, SparseGraph
+
+TEST_PATH = Path(__file__) / ".."
+
+
+@pytest.fixture(scope="function", params=[Graph, SparseGraph])
+def k5_plus_one(request):
+    """
+    Graph:
+        1 - 2
+        | X |
+        3 - 4 - 5
+    """
+    k5_plus_one_path = (TEST_PATH / "k5_plus_one.mtx").resolve()
+    graph = request.param(str(k5_plus_one_path))
+    yield graph
@@ -0,0 +1,207 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.maxclique.algorithms import (
+    AntColonyOptimizerAlgorithm,
+    BatchReferenceAlgorithm,
+    BranchAndBoundAlgorithm,
+    NumpyAntColonyOptimizerAlgorithm,
+    ParallelAntColonyOptimizerAlgorithm,
+    ReferenceAlgorithm,
+    VertexPheromone,
+    choose_weighted,
+    improve_clique,
+)
+from src.maxclique.graph import Graph, SparseGraph
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_choose_weighted_skips_zero_weights():
+    rng = np.random.default_rng(0)
+    weights = np.array(
+        [
+            [0.0, 1.0, 0.0, 3.0],
+            [1e-12, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 1e12],
+        ]
+    )
+
+    for _ in range(100):
+        chosen = choose_weighted(weights, rng)
+        assert chosen[0] in (1, 3)
+        assert chosen[1] == 0
+        assert chosen[2] == 3
+
+
+@pytest.mark.parametrize(
+    "algorithm", [AntColonyOptimizerAlgorithm, NumpyAntColonyOptimizerAlgorithm]
+)
+@pytest.mark.parametrize("pheromone", ["edge", "vertex"])
+def test_aco_finds_max_clique(k5_plus_one, algorithm, pheromone):
+    algo = algorithm(
+        graph=k5_plus_one,
+        output=None,
+        iterations=3,
+        ants=4,
+        alpha=2.0,
+        rho=0.9,
+        pheromone=pheromone,
+    )
+
+    result = algo.run()
+
+    assert result.best_clique_size == 5
+
+
+@pytest.mark.parametrize("graph_class", [Graph, SparseGraph])
+def test_parallel_aco_is_repeatable(graph_class):
+    keller4_path = (TEST_PATH / ".." / "input" / "keller4.mtx").resolve()
+    pheromones = []
+    for _ in range(2):
+        graph = graph_class(str(keller4_path))
+        algo = ParallelAntColonyOptimizerAlgorithm(
+            graph=graph,
+            output=None,
+            iterations=3,
+            ants=8,
+            alpha=2.0,
+            rho=0.9,
+            workers=2,
+            seed=42,
+        )
+        algo.run()
+        pheromones.append(graph.edges)
+
+    assert pheromones[0] == pheromones[1]
+
+
+@pytest.mark.parametrize(
+    "file, expected_size",
+    [
+        ("soc-dolphins.mtx", 5),
+        ("keller4.mtx", 11),
+    ],
+)
+def test_branch_and_bound_proves_optimum(file, expected_size):
+    graph = Graph(str((TEST_PATH / ".." / "input" / file).resolve()))
+    algo = BranchAndBoundAlgorithm(graph=graph, output=None)
+
+    result = algo.run()
+
+    assert result.best_clique_size == result.upper_bound == expected_size
+    assert len(algo.best_clique) == expected_size
+    for node_a in algo.best_clique:
+        for node_b in algo.best_clique:
+            assert node_a == node_b or graph.has_edge_between(node_a, node_b)
+
+
+def test_branch_and_bound_on_sparse_graph(tmp_path):
+    path_graph = tmp_path / "path.mtx"
+    lines = ["%%MatrixMarket matrix coordinate pattern symmetric", "3000 3000 3002"]
+    lines += [f"{node + 1} {node}" for node in range(1, 3000)]
+    lines += ["1 3", "2 3", "1 2"]
+    path_graph.write_text("\n".join(lines) + "\n")
+    algo = BranchAndBoundAlgorithm(graph=SparseGraph(str(path_graph)), output=None)
+
+    result = algo.run()
+
+    assert result.best_clique_size == result.upper_bound == 3
+    assert sorted(algo.best_clique) == [0, 1, 2]
+
+
+def test_branch_and_bound_time_limit():
+    graph = Graph(str((TEST_PATH / ".." / "input" / "C250-9.mtx").resolve()))
+    algo = BranchAndBoundAlgorithm(graph=graph, output=None, time_limit=0.5)
+
+    result = algo.run()
+
+    assert result.execution_time < 5
+    assert result.best_clique_size <= 44 <= result.upper_bound
+
+
+def test_improve_clique_swaps_to_larger_clique(k5_plus_one):
+    rng = np.random.default_rng(0)
+
+    improved = improve_clique(k5_plus_one, [4, 5], steps=10, rng=rng, tabu_tenure=3)
+
+    assert sorted(improved) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "params, stop_reason, restarts",
+    [
+        ({}, "iterations", 0),
+        ({"target_size": 5}, "target_size", 0),
+        ({"time_budget": 1e-9}, "time_budget", 0),
+        ({"target_size": 6, "stagnation_window": 2, "restarts": 1}, "stagnation", 1),
+    ],
+)
+def test_aco_stop_reason(k5_plus_one, params, stop_reason, restarts):
+    algo = NumpyAntColonyOptimizerAlgorithm(
+        graph=k5_plus_one,
+        output=None,
+        iterations=20,
+        ants=4,
+        alpha=2.0,
+        rho=0.9,
+        **params,
+    )
+
+    result = algo.run()
+
+    assert result.stop_reason == stop_reason
+    assert result.restarts == restarts
+    assert result.stop_iteration <= 20
+
+
+def test_vertex_pheromone_update(k5_plus_one):
+    pheromone = VertexPheromone(k5_plus_one)
+    pheromone.fill(1.0)
+
+    pheromone.evaporate(0.5, 0.1)
+    pheromone.deposit([0, 1], 1.0, 1.2)
+
+    factors = pheromone.get_factors(None, [0, 1, 2, 5])
+    assert factors.tolist() == [1.2, 1.2, 0.5, 0.5]
+    assert pheromone.get_stats()["max"] == 1.2
+
+
+def test_batch_reference_finds_max_clique(k5_plus_one):
+    algo = BatchReferenceAlgorithm(
+        graph=k5_plus_one, output=None, agents=10, batch_size=4, seed=0
+    )
+
+    result = algo.run()
+
+    assert result.agents == 10
+    assert result.best_clique_size == 5
+    assert algo.best_clique == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "algorithm, params",
+    [
+        (AntColonyOptimizerAlgorithm, dict(iterations=3, ants=5, alpha=2, rho=0.9)),
+        (
+            NumpyAntColonyOptimizerAlgorithm,
+            dict(iterations=3, ants=5, alpha=2, rho=0.9),
+        ),
+        (ReferenceAlgorithm, dict(agents=10)),
+        (BatchReferenceAlgorithm, dict(agents=10)),
+    ],
+)
+def test_seeded_runs_are_repeatable(algorithm, params):
+    keller4_path = (TEST_PATH / ".." / "input" / "keller4.mtx").resolve()
+    graph = Graph(str(keller4_path))
+    runs = []
+    for _ in range(2):
+        events = []
+        algo = algorithm(graph=graph, output=None, seed=7, **params)
+        algo.subscribe(events.append)
+        algo.run()
+        runs.append((algo.best_clique, [event.best_clique_size for event in events]))
+
+    assert runs[0] == runs[1]
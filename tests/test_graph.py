@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from maxclique.config import INPUT_DIR
@@ -9,6 +10,9 @@ from src.maxclique.graph import (
     Edge,
     Graph,
     Node,
+    NoSuchNodeException,
+    SparseGraph,
+    open_graph,
 )
 
 TEST_PATH = Path(__file__) / ".."
@@ -27,19 +31,6 @@ def k5_graph():
     yield graph
 
 
-@pytest.fixture(scope="function")
-def k5_plus_one():
-    """
-    Graph:
-        1 - 2
-        | X |
-        3 - 4 - 5
-    """
-    k5_plus_one_path = (TEST_PATH / "k5_plus_one.mtx").resolve()
-    graph = Graph(str(k5_plus_one_path))
-    yield graph
-
-
 @pytest.mark.parametrize(
     "node, outgoing_edges",
     [
@@ -127,3 +118,224 @@ def test_get_candidates(k5_graph):
 def test_node_neighbors(k5_graph, k5_plus_one):
     assert k5_graph.get_node_neighbours(0) == {1, 2, 3, 4}
     assert k5_plus_one.get_node_neighbours(5) == {4}
+
+
+def test_neighbours_and_degree(k5_plus_one):
+    assert k5_plus_one.get_neighbours(4).tolist() == [0, 1, 2, 3, 5]
+    assert k5_plus_one.get_degree(4) == 5
+    assert k5_plus_one.get_degree(5) == 1
+
+
+def test_neighbours_are_read_only(k5_plus_one):
+    with pytest.raises(ValueError):
+        k5_plus_one.get_neighbours(5)[0] = 0
+    if type(k5_plus_one) is Graph:
+        with pytest.raises(ValueError):
+            k5_plus_one.get_neighbourhood(5)[0] = 0
+
+    assert k5_plus_one.get_node_neighbours(5) == {4}
+
+
+def test_has_edge_between(k5_plus_one):
+    assert k5_plus_one.has_edge_between(3, 4)
+    assert k5_plus_one.has_edge_between(4, 5)
+    assert not k5_plus_one.has_edge_between(0, 5)
+    assert not k5_plus_one.has_edge_between(5, 5)
+
+
+def test_get_edge_by_nodes(k5_plus_one):
+    k5_plus_one.set_pheromone(4, 5, 2.5)
+
+    assert k5_plus_one.get_edge_by_nodes(5, 4) == Edge(5, 4, 2.5)
+    assert k5_plus_one.get_edge_by_nodes(0, 5) is None
+
+
+def test_set_pheromone_without_edge(k5_plus_one):
+    k5_plus_one.fill_pheromone(1.0)
+
+    with pytest.raises(ValueError):
+        k5_plus_one.set_pheromone(0, 5, 3.0)
+    assert k5_plus_one.get_pheromone_stats()["max"] == 1.0
+
+
+def test_edges_view(k5_plus_one):
+    k5_plus_one.set_pheromone(4, 5, 2.5)
+    edges = k5_plus_one.edges
+
+    assert len(edges) == 22
+    assert Edge(5, 4, 2.5) in edges
+    assert Edge(5, 4, 0.0) not in edges
+    assert Edge(0, 5, 0.0) not in edges
+    assert (4, 5) not in edges
+    assert max(edges) == Edge(5, 4, 2.5)
+
+
+def test_get_edge_ids(k5_plus_one):
+    edge_ids = k5_plus_one.get_edge_ids([0, 1, 0, 5], [1, 0, 5, 5])
+
+    assert edge_ids[0] == edge_ids[1] >= 0
+    assert edge_ids[2:].tolist() == [-1, -1]
+
+
+@pytest.mark.parametrize("node_a, node_b", [(0, 8), (1, -4), (-1, 0), (6, 0)])
+def test_edge_lookup_outside_graph(k5_plus_one, node_a, node_b):
+    with pytest.raises(NoSuchNodeException):
+        k5_plus_one.has_edge_between(node_a, node_b)
+    with pytest.raises(NoSuchNodeException):
+        k5_plus_one.get_edge_by_nodes(node_a, node_b)
+    with pytest.raises(NoSuchNodeException):
+        k5_plus_one.get_edge_ids([0, node_a], [1, node_b])
+    assert Edge(node_a, node_b, 0.0) not in k5_plus_one.edges
+
+
+def test_clique_edges_after_unsafe_add(k5_plus_one):
+    k5_plus_one.set_pheromone(4, 5, 2.5)
+    clique = Clique(graph=k5_plus_one)
+
+    for node in (4, 5, 0):
+        clique.add_node(node, unsafe=True)
+
+    assert clique.edges == {Edge(5, 4, 2.5), Edge(0, 4, 0.0)}
+
+
+@pytest.mark.parametrize("pheromone_factors", [True, False])
+def test_get_candidates_after_unsafe_add(k5_plus_one, pheromone_factors):
+    clique = Clique(graph=k5_plus_one, pheromone_factors=pheromone_factors)
+
+    clique.add_node(4)
+    assert clique.get_candidates() == [0, 1, 2, 3, 5]
+
+    clique.add_node(5)
+    assert clique.get_candidates() == []
+
+    clique.add_node(0, unsafe=True)
+    assert clique.get_candidates() == []
+
+
+def test_get_pheromone_factor(k5_plus_one):
+    graph = k5_plus_one
+    graph.set_pheromone(0, 4, 1.5)
+    graph.set_pheromone(1, 4, 2.0)
+    clique = Clique(graph=graph)
+
+    clique.add_node(0)
+    clique.add_node(1)
+
+    assert clique.get_pheromone_factor(4) == 3.5
+    assert clique.get_pheromone_factor(2) == 0.0
+    assert list(clique.get_pheromone_factors([4, 2])) == [3.5, 0.0]
+
+
+def test_clique_edge_lookup(k5_plus_one):
+    k5_plus_one.set_pheromone(4, 5, 2.5)
+    clique = Clique(graph=k5_plus_one)
+
+    for node in (4, 5, 0):
+        clique.add_node(node, unsafe=True)
+
+    assert clique.has_edge_between(5, 4)
+    assert not clique.has_edge_between(0, 5)
+    assert not clique.has_edge_between(0, 1)
+    assert clique.get_edge_by_nodes(4, 5) == Edge(4, 5, 2.5)
+    assert clique.get_edge_by_nodes(0, 1) is None
+
+
+def test_clique_without_pheromone_factors(k5_plus_one):
+    clique = Clique(graph=k5_plus_one, pheromone_factors=False)
+
+    clique.add_node(0)
+    clique.add_node(1)
+
+    assert clique.get_candidates() == [2, 3, 4]
+    with pytest.raises(ValueError):
+        clique.get_pheromone_factors([4])
+
+
+def test_pheromone_update(k5_plus_one):
+    graph = k5_plus_one
+    graph.fill_pheromone(1.0)
+
+    graph.evaporate_pheromone(rho=0.5, minimum=0.6)
+    assert graph.get_edge_by_nodes(0, 1).pheromone == 0.6
+
+    graph.deposit_pheromone(graph.get_edge_ids_between([0, 1, 2]), 0.3, maximum=0.8)
+    assert graph.get_edge_by_nodes(1, 0).pheromone == 0.8
+    assert graph.get_edge_by_nodes(2, 1).pheromone == 0.8
+    assert graph.get_edge_by_nodes(4, 5).pheromone == 0.6
+
+
+def test_get_edge_ids_between_requires_clique(k5_plus_one):
+    with pytest.raises(CliqueConstraintViolationError):
+        k5_plus_one.get_edge_ids_between([0, 5])
+    with pytest.raises(NoSuchNodeException):
+        k5_plus_one.get_edge_ids_between([5, 6])
+
+
+def test_graph_cache(tmp_path, monkeypatch):
+    source = tmp_path / "k5_plus_one.mtx"
+    source.write_text((TEST_PATH / "k5_plus_one.mtx").resolve().read_text())
+    parsed = Graph(source)
+
+    with np.load(tmp_path / "k5_plus_one.mtx.npz") as cache:
+        assert sorted(cache.files) == ["_edge_ids", "_indices", "_indptr", "signature"]
+
+    monkeypatch.setattr("src.maxclique.graph.read_graph", None)
+    cached = Graph(source)
+
+    assert cached.nodes == parsed.nodes
+    assert cached.edges == parsed.edges
+    assert cached.get_node_neighbours(5) == {4}
+
+
+@pytest.mark.parametrize("graph_class", [Graph, SparseGraph])
+def test_graph_nbytes(graph_class):
+    graph = graph_class(str((INPUT_DIR / "keller4.mtx").resolve()))
+    adjacency = getattr(graph, "_adjacency", np.empty(0))
+    # Both directions of every edge take int32 neighbour and edge id, pheromone
+    # is a single float64 per edge
+    per_edge = 2 * (4 + 4) + 8
+
+    assert graph.nbytes == adjacency.nbytes + 8 * (graph.node_count + 1) + (
+        per_edge * graph.edge_count
+    )
+    assert graph.nbytes < 8 * graph.node_count**2
+
+
+def test_graph_cache_invalidation(tmp_path):
+    source = tmp_path / "graph.mtx"
+    source.write_text((TEST_PATH / "k5.mtx").resolve().read_text())
+    Graph(source)
+    source.write_text((TEST_PATH / "k5_plus_one.mtx").resolve().read_text())
+
+    assert repr(Graph(source)) == "Graph(6, 22)"
+
+
+def test_sparse_graph_matches_dense():
+    path = str((INPUT_DIR / "soc-dolphins.mtx").resolve())
+    dense = Graph(path)
+    sparse = SparseGraph(path)
+    nodes = np.arange(dense.node_count)
+
+    assert not hasattr(sparse, "_adjacency")
+    assert repr(sparse) == repr(dense).replace("Graph", "SparseGraph")
+    assert sparse.edges == dense.edges
+    assert np.array_equal(
+        sparse.get_adjacency_rows(nodes), dense.get_adjacency_rows(nodes)
+    )
+    for node_a in range(dense.node_count):
+        for node_b in range(dense.node_count):
+            assert sparse.has_edge_between(node_a, node_b) == dense.has_edge_between(
+                node_a, node_b
+            )
+
+
+def test_open_graph_chooses_by_density(tmp_path):
+    path_graph = tmp_path / "path.mtx"
+    lines = ["%%MatrixMarket matrix coordinate pattern symmetric", "300 300 299"]
+    lines += [f"{node + 1} {node}" for node in range(1, 300)]
+    path_graph.write_text("\n".join(lines) + "\n")
+
+    assert type(open_graph(path_graph)) is SparseGraph
+    assert type(open_graph(path_graph, sparse=False)) is Graph
+    assert type(open_graph(INPUT_DIR / "soc-dolphins.mtx")) is Graph
+    assert len(open_graph(path_graph).get_node_neighbours(150)) == 2
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from src.maxclique.graph import Graph
+from src.maxclique.preprocessing import core_order, greedy_clique, reduce_graph
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_core_order():
+    graph = Graph(str((TEST_PATH / "k5_plus_one.mtx").resolve()))
+
+    order, cores = core_order(graph)
+
+    assert order[0] == 5
+    assert sorted(order.tolist()) == [0, 1, 2, 3, 4, 5]
+    assert cores.tolist() == [4, 4, 4, 4, 4, 1]
+
+
+def test_reduce_graph():
+    graph = Graph(str((TEST_PATH / "k5_plus_one.mtx").resolve()))
+
+    reduction = reduce_graph(graph)
+
+    assert reduction.lower_bound == 5
+    assert repr(reduction.graph) == "Graph(5, 20)"
+    assert reduction.to_original([0, 1, 2, 3, 4]) == [0, 1, 2, 3, 4]
+
+
+def test_reduce_graph_preserves_maximum_clique():
+    graph = Graph(str((TEST_PATH / ".." / "input" / "soc-dolphins.mtx").resolve()))
+
+    reduction = reduce_graph(graph)
+
+    assert len(reduction.graph.nodes) < len(graph.nodes)
+    clique = reduction.to_original(greedy_clique(reduction.graph))
+    assert len(clique) == 5
+    for node_a in clique:
+        for node_b in clique:
+            assert node_a == node_b or graph.has_edge_between(node_a, node_b)
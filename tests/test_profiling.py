@@ -0,0 +1,66 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from src.maxclique.algorithms import (
+    AntColonyOptimizerAlgorithm,
+    NumpyAntColonyOptimizerAlgorithm,
+)
+from src.maxclique.graph import Graph
+from src.maxclique.profiling import NULL_PHASE, Profiler
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+
+    assert profiler.phase("choice") is NULL_PHASE
+    profiler.record_candidates(1, 10)
+    profiler.end_iteration()
+
+    assert profiler.iterations == []
+
+
+@pytest.mark.parametrize(
+    "algorithm", [AntColonyOptimizerAlgorithm, NumpyAntColonyOptimizerAlgorithm]
+)
+def test_profiled_aco_run(tmp_path, algorithm):
+    graph = Graph(str((TEST_PATH / "k5.mtx").resolve()))
+    algo = algorithm(graph=graph, output=None, iterations=2, ants=3, alpha=1, rho=0.9)
+    algo.profiler = Profiler()
+
+    result = algo.run()
+    algo.profiler.save(tmp_path / "profile.json", result)
+
+    with open(tmp_path / "profile.json") as f:
+        profile = json.load(f)
+    assert profile["result"]["best_clique_size"] == 5
+    assert len(profile["iterations"]) == 2
+    phases = profile["iterations"][0]["phases"]
+    assert phases["construction"]["calls"] == 1
+    assert phases["add_node"]["calls"] >= 4
+    assert profile["iterations"][0]["candidates"][0]["step"] == 1
+
+
+def test_profile_csv_export(tmp_path):
+    graph = Graph(str((TEST_PATH / "k5.mtx").resolve()))
+    algo = NumpyAntColonyOptimizerAlgorithm(
+        graph=graph, output=None, iterations=2, ants=3, alpha=1, rho=0.9
+    )
+    algo.profiler = Profiler()
+
+    result = algo.run()
+    algo.profiler.save(tmp_path / "profile.csv", result)
+
+    with open(tmp_path / "profile.csv") as f:
+        phases = list(csv.DictReader(f))
+    with open(tmp_path / "profile.candidates.csv") as f:
+        candidates = list(csv.DictReader(f))
+    with open(tmp_path / "profile.result.csv") as f:
+        results = list(csv.DictReader(f))
+    assert {row["iteration"] for row in phases} == {"0", "1"}
+    assert candidates[0]["iteration"] == "0" and candidates[0]["step"] == "1"
+    assert len(results) == 1 and results[0]["best_clique_size"] == "5"
@@ -0,0 +1,45 @@
+import io
+import json
+from pathlib import Path
+
+from src.maxclique.algorithms import AntColonyOptimizerAlgorithm
+from src.maxclique.graph import Graph
+from src.maxclique.progress import ConsoleProgress, JsonLinesTrace, ProgressEvent
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_aco_reports_every_iteration(tmp_path):
+    graph = Graph(str((TEST_PATH / "k5.mtx").resolve()))
+    algo = AntColonyOptimizerAlgorithm(
+        graph=graph, output=None, iterations=3, ants=2, alpha=1, rho=0.9
+    )
+    events = []
+    algo.subscribe(events.append)
+    trace = JsonLinesTrace(tmp_path / "trace.jsonl")
+    algo.subscribe(trace)
+
+    algo.run()
+    trace.close()
+
+    assert [event.iteration for event in events] == [0, 1, 2]
+    assert events[-1].best_clique_size == 5
+    assert events[-1].pheromone["max"] <= AntColonyOptimizerAlgorithm.PHEROMONE_MAX
+    with open(tmp_path / "trace.jsonl") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 3
+    assert lines[0]["pheromone"]["min"] >= AntColonyOptimizerAlgorithm.PHEROMONE_MIN
+
+
+def test_console_progress_is_rate_limited():
+    stream = io.StringIO()
+    console = ConsoleProgress(interval=3600, stream=stream)
+
+    for iteration in range(100):
+        console(ProgressEvent(iteration, 5, 0.0))
+    console.close()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("0: 5")
+    assert lines[1].startswith("99: 5")
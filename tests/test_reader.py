@@ -0,0 +1,65 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.maxclique.graph import Graph
+from src.maxclique.reader import GraphHeader, read_graph, read_header
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_clq_matches_mtx():
+    clq = Graph(str((TEST_PATH / "k5_plus_one.clq").resolve()), cache=False)
+    mtx = Graph(str((TEST_PATH / "k5_plus_one.mtx").resolve()), cache=False)
+
+    assert clq.edges == mtx.edges
+    assert clq.nodes == mtx.nodes
+
+
+def test_read_graph_in_chunks():
+    source = io.StringIO(
+        "%%MatrixMarket matrix coordinate integer general\n"
+        "% comment\n"
+        "4 4 7\n"
+        "1 2 1\n"
+        "2 1 1\n"
+        "3 3 1\n"
+        "% comment between entries\n"
+        "4 1 2\n"
+        "1 4 2\n"
+        "1 2 3\n"
+        "\n"
+        "3 2 1"
+    )
+
+    node_count, keys = read_graph(source, chunk_size=8)
+
+    assert node_count == 4
+    assert np.divmod(keys, 4)[0].tolist() == [0, 0, 1, 1, 2, 3]
+    assert np.divmod(keys, 4)[1].tolist() == [1, 3, 0, 2, 1, 0]
+
+
+@pytest.mark.parametrize(
+    "file, expected_header",
+    [
+        ("k5_plus_one.mtx", GraphHeader("mtx", 6, 21, True)),
+        ("k5_plus_one.clq", GraphHeader("clq", 6, 11, True)),
+    ],
+)
+def test_read_header(file, expected_header):
+    assert read_header((TEST_PATH / file).resolve()) == expected_header
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "%%MatrixMarket matrix array real general\n2 2\n1\n0\n0\n1\n",
+        "c no problem line\ne 1 2\n",
+        "p edge 2 1\ne 1 3\n",
+    ],
+)
+def test_invalid_files(content):
+    with pytest.raises(ValueError):
+        read_graph(io.StringIO(content))
@@ -0,0 +1,55 @@
+import pytest
+
+from src.maxclique.results import RANK_CSV_COLUMNS, ResultStore, load_experiments
+
+
+def test_appended_parts_are_merged(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append("ref", [{"file": "a.mtx", "agents": 10, "best_clique_size": 5}])
+    store.append("ref", [{"file": "b.mtx", "agents": 20, "best_clique_size": 6}])
+
+    assert len(store.load("ref")) == 2
+
+    store.merge("ref")
+
+    assert not list((tmp_path / "parts").iterdir())
+    results = store.load("ref")
+    assert results["file"].tolist() == ["a.mtx", "b.mtx"]
+    assert results["best_clique_size"].tolist() == [5, 6]
+    assert results["execution_time"].isna().all()
+
+
+def test_unknown_column_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResultStore(tmp_path).append("aco", [{"file": "a.mtx", "score": 5}])
+
+
+def test_import_csv(tmp_path):
+    csv_path = tmp_path / "keller4.mtx.csv"
+    csv_path.write_text("16,100,1.0,0.9,11,0.5\n16,200,2.0,0.8,10,0.7\n")
+    store = ResultStore(tmp_path)
+
+    store.import_csv("aco", csv_path, "keller4.mtx")
+    aco_results, ref_results = load_experiments(store)
+
+    assert aco_results["searches"].tolist() == [1600, 3200]
+    assert aco_results["score"].tolist() == [11, 10]
+    assert aco_results["stop_reason"].isna().all()
+    assert ref_results.empty
+
+
+def test_benchmark_results_are_kept_apart(tmp_path):
+    csv_path = tmp_path / "rank_C500-9.mtx.csv"
+    csv_path.write_text("16,1.0,0.9,51,548.0\n16,2.0,0.8,50,560.0\n")
+    store = ResultStore(tmp_path)
+
+    store.import_csv(
+        "aco", csv_path, "C500-9.mtx", columns=RANK_CSV_COLUMNS, benchmark="rank"
+    )
+    aco_results, _ = load_experiments(store)
+    stored = store.load("aco")
+
+    assert aco_results.empty
+    assert stored["benchmark"].tolist() == ["rank", "rank"]
+    assert stored["rho"].tolist() == [0.9, 0.8]
+    assert stored["iterations"].isna().all()
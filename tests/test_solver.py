@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.maxclique.graph import Graph
+from src.maxclique.solver import Solver
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_warm_start_converges_faster():
+    graph = Graph(str((TEST_PATH / ".." / "input" / "C250-9.mtx").resolve()))
+    solver = Solver(graph, ants=16, alpha=2.0, rho=0.95, seed=0)
+
+    cold = solver.solve(iterations=300, target_size=42)
+    warm = solver.solve(iterations=300, target_size=42)
+
+    assert cold.stop_reason == warm.stop_reason == "target_size"
+    assert warm.stop_iteration * 4 < cold.stop_iteration
+    assert len(solver.best_clique) >= 42
+
+
+@pytest.mark.parametrize("pheromone", ["edge", "vertex"])
+def test_pheromone_checkpoint(tmp_path, pheromone):
+    path = str((TEST_PATH / "k5_plus_one.mtx").resolve())
+    solver = Solver(Graph(path), ants=4, rho=0.9, pheromone=pheromone, seed=1)
+    solver.solve(iterations=3)
+    solver.save_pheromone(tmp_path / "pheromone.npy")
+
+    restored = Solver(Graph(path), ants=4, rho=0.9, pheromone=pheromone)
+    assert not restored.warm
+    restored.load_pheromone(tmp_path / "pheromone.npy")
+
+    assert restored.warm
+    assert np.array_equal(
+        restored.pheromone.get_trails(), solver.pheromone.get_trails()
+    )
+    assert restored.solve(iterations=1).best_clique_size == 5
+    restored.reset()
+    assert not restored.warm
+
+
+def test_checkpoint_of_other_graph_is_rejected(tmp_path):
+    solver = Solver(Graph(str((TEST_PATH / "k5.mtx").resolve())), ants=4)
+    solver.solve(iterations=1)
+    solver.save_pheromone(tmp_path / "pheromone.npy")
+
+    other = Solver(Graph(str((TEST_PATH / "k5_plus_one.mtx").resolve())), ants=4)
+    with pytest.raises(ValueError):
+        other.load_pheromone(tmp_path / "pheromone.npy")
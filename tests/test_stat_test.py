@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from scipy.stats import wilcoxon
+
+from src.maxclique.scripts.stat_test import signed_rank_pvalues
+
+
+@pytest.mark.parametrize("alternative", ["greater", "less"])
+def test_signed_rank_pvalues_match_scipy(alternative):
+    rng = np.random.default_rng(0)
+    differences = np.concatenate(
+        [
+            # Ties and zeros, tested by enumeration of sign assignments
+            rng.integers(-2, 3, (5, 8)).astype(float),
+            # Distinct values, tested with scipy's exact distribution
+            rng.normal(size=(5, 8)),
+        ]
+    )
+
+    expected = [
+        wilcoxon(row, alternative=alternative, zero_method="zsplit")[1]
+        for row in differences
+    ]
+
+    assert np.allclose(signed_rank_pvalues(differences, alternative), expected)
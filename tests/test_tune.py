@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from src.maxclique.scripts.run import AcoParam
+from src.maxclique.scripts.tune import race
+
+TEST_PATH = Path(__file__) / ".."
+
+
+def test_race_spends_budget_in_rounds():
+    candidates = [AcoParam(0.9, 1), AcoParam(0.9, 2), AcoParam(0.8, 1)]
+
+    ranking = race(
+        (TEST_PATH / "k5.mtx").resolve(),
+        candidates,
+        budget=10,
+        iterations=2,
+        ants=3,
+        first_test=2,
+    )
+
+    # Every configuration finds K5, so none of them is eliminated
+    assert ranking["runs"].tolist() == [3, 3, 3]
+    assert ranking["score"].tolist() == [5, 5, 5]
+    assert ranking["eliminated_in_round"].isna().all()